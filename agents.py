@@ -2,53 +2,282 @@
 AI Agent implementations for the Multi-Agent Orchestration Platform
 """
 import asyncio
+import hashlib
 import json
 import time
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Dict, List, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, AsyncIterator, Iterable, Mapping, Tuple, Type
 
-from config import get_llm_instance, AGENT_TYPES
-from models import TaskStatus, AgentStatus, MessageType
+from batch_client import build_batch_request, create_batch, fetch_batch_results
+from config import get_llm_instance, AGENT_TYPES, PLATFORM_CONFIG, LLM_BATCHER
+from models import TaskStatus, AgentStatus, MessageType, AgentResult, TaskRecord
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage, SystemMessage
+
+# Agent type settings never change after import, so resolve them once here
+_RESEARCH_CAPS = frozenset(AGENT_TYPES["research"]["capabilities"])
+_RESEARCH_MAX = AGENT_TYPES["research"]["max_concurrent_tasks"]
+_CODE_CAPS = frozenset(AGENT_TYPES["code"]["capabilities"])
+_CODE_MAX = AGENT_TYPES["code"]["max_concurrent_tasks"]
+_CREATIVE_CAPS = frozenset(AGENT_TYPES["creative"]["capabilities"])
+_CREATIVE_MAX = AGENT_TYPES["creative"]["max_concurrent_tasks"]
+_ANALYSIS_CAPS = frozenset(AGENT_TYPES["analysis"]["capabilities"])
+_ANALYSIS_MAX = AGENT_TYPES["analysis"]["max_concurrent_tasks"]
+_COMMUNICATION_CAPS = frozenset(AGENT_TYPES["communication"]["capabilities"])
+_COMMUNICATION_MAX = AGENT_TYPES["communication"]["max_concurrent_tasks"]
+
+# Success rate is an EWMA of task outcomes, floored to keep the load score finite
+_SUCCESS_ALPHA = PLATFORM_CONFIG["success_rate_alpha"]
+_MIN_SUCCESS_RATE = 1e-3
+
+# Shared task prompt header; each agent appends its own instructions
+TASK_PROMPT_PREFIX = (
+    "Task: {title}\n"
+    "Description: {description}\n"
+    "Required Capabilities: {required_capabilities}\n\n"
+)
+
+# System prompts are constant per agent type, so build them once at import time
+RESEARCH_SYSTEM_PROMPT = """You are a Research Agent specialized in data analysis, research, and information gathering.
+        Your capabilities include:
+        - Data analysis and interpretation
+        - Web research and fact-checking
+        - Literature reviews and market research
+        - Statistical analysis of datasets
+        - Trend identification and pattern recognition
+        
+        When given a task, provide thorough, well-researched responses with citations and evidence.
+        Focus on accuracy, completeness, and actionable insights."""
+
+CODE_SYSTEM_PROMPT = """You are a Code Agent specialized in software development and engineering.
+        Your capabilities include:
+        - Code generation and implementation
+        - Debugging and error resolution
+        - Code review and optimization
+        - Architecture design and planning
+        - Testing and quality assurance
+        
+        When given a coding task, provide clean, efficient, well-documented code.
+        Follow best practices and include error handling where appropriate."""
+
+CREATIVE_SYSTEM_PROMPT = """You are a Creative Agent specialized in content creation and creative problem-solving.
+        Your capabilities include:
+        - Content creation and creative writing
+        - Design thinking and ideation
+        - Brainstorming and innovation
+        - Storytelling and narrative development
+        - Creative problem-solving approaches
+        
+        When given a creative task, think outside the box and provide original, engaging content.
+        Focus on creativity, originality, and emotional impact."""
+
+ANALYSIS_SYSTEM_PROMPT = """You are an Analysis Agent specialized in data processing and statistical analysis.
+        Your capabilities include:
+        - Statistical analysis and data processing
+        - Pattern recognition and trend analysis
+        - Forecasting and predictive modeling
+        - Optimization and performance analysis
+        - Data visualization recommendations
+        
+        When given an analysis task, provide thorough statistical insights with clear interpretations.
+        Focus on accuracy, statistical significance, and actionable recommendations."""
+
+COMMUNICATION_SYSTEM_PROMPT = """You are a Communication Agent specialized in language processing and communication.
+        Your capabilities include:
+        - Text summarization and synthesis
+        - Translation and localization
+        - Sentiment analysis and tone detection
+        - Communication drafting and editing
+        - Language processing and understanding
+        
+        When given a communication task, focus on clarity, tone, and effectiveness.
+        Ensure messages are well-structured and appropriate for the target audience."""
 
 class BaseAgent(ABC):
     """Base class for all AI agents in the orchestration platform"""
     
-    def __init__(self, agent_id: str, agent_type: str, name: str, capabilities: List[str]):
+    __slots__ = (
+        "agent_id", "agent_type", "name", "capabilities", "status", "current_tasks",
+        "llm", "max_concurrent_tasks", "_load_score", "_tasks_completed",
+        "_avg_completion_time", "_success_rate", "_last_active_ns", "_sem",
+        "_priority_weight"
+    )
+    
+    # Per-agent-type prompt pieces, defined by each subclass
+    _SYSTEM_PROMPT: str
+    _TASK_TEMPLATE: str
+    
+    # Exact-match response cache shared by all agents: prompt hash -> (stored_at, content)
+    _RESPONSE_CACHE: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+    
+    def __init__(self, agent_id: str, agent_type: str, name: str, capabilities: Iterable[str],
+                 max_concurrent_tasks: int):
         self.agent_id = agent_id
         self.agent_type = agent_type
         self.name = name
-        self.capabilities = capabilities
+        self.capabilities = frozenset(capabilities)
         self.status = AgentStatus.IDLE
-        self.current_tasks = []
-        self.performance_metrics = {
-            "tasks_completed": 0,
-            "average_completion_time": 0.0,
-            "success_rate": 1.0,
-            "last_active": datetime.utcnow()
-        }
+        self.current_tasks: set = set()
+        self._tasks_completed = 0
+        self._avg_completion_time = 0.0
+        self._success_rate = 1.0
+        self._last_active_ns = time.monotonic_ns()
         self.llm = get_llm_instance()
-        self.max_concurrent_tasks = AGENT_TYPES[agent_type]["max_concurrent_tasks"]
+        self.max_concurrent_tasks = max_concurrent_tasks
+        self._priority_weight = AGENT_TYPES[agent_type]["priority_weight"]
+        self._load_score = 0.0
+        self._sem = asyncio.Semaphore(self.max_concurrent_tasks)
         
-    def can_handle_task(self, required_capabilities: List[str]) -> bool:
+    def can_handle_task(self, required_capabilities: Iterable[str]) -> bool:
         """Check if agent has the required capabilities for a task"""
-        return all(cap in self.capabilities for cap in required_capabilities)
+        return self.capabilities.issuperset(required_capabilities)
     
-    def get_load_score(self) -> float:
-        """Calculate current load score for load balancing"""
+    def _recompute_load(self):
+        """Refresh the cached load score after current_tasks or success_rate change"""
         load_ratio = len(self.current_tasks) / self.max_concurrent_tasks
-        return load_ratio * (1 / self.performance_metrics["success_rate"])
+        self._load_score = load_ratio * (1.0 / self._success_rate) / self._priority_weight
+    
+    def _update_success_rate(self, outcome: float):
+        """Fold a task outcome (1.0 success, 0.0 failure) into the success-rate EWMA"""
+        self._success_rate += _SUCCESS_ALPHA * (outcome - self._success_rate)
+        self._success_rate = min(1.0, max(_MIN_SUCCESS_RATE, self._success_rate))
+        self._recompute_load()
+    
+    def get_load_score(self) -> float:
+        """Get current load score for load balancing"""
+        return self._load_score
     
     async def update_status(self, new_status: AgentStatus):
         """Update agent status"""
         self.status = new_status
-        self.performance_metrics["last_active"] = datetime.utcnow()
+        self._last_active_ns = time.monotonic_ns()
     
-    @abstractmethod
-    async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    @property
+    def success_rate(self) -> float:
+        """Current success rate used for scheduling"""
+        return self._success_rate
+    
+    @property
+    def tasks_completed(self) -> int:
+        """Number of tasks this agent has completed"""
+        return self._tasks_completed
+    
+    @property
+    def performance_metrics(self) -> Dict[str, Any]:
+        """Performance metrics for dashboards, with last_active as a wall-clock ISO timestamp"""
+        idle_seconds = (time.monotonic_ns() - self._last_active_ns) / 1e9
+        return {
+            "tasks_completed": self._tasks_completed,
+            "average_completion_time": self._avg_completion_time,
+            "success_rate": self._success_rate,
+            "last_active": (datetime.now(timezone.utc) - timedelta(seconds=idle_seconds)).isoformat()
+        }
+    
+    async def process_task_stream(self, messages: List["BaseMessage"]) -> AsyncIterator[str]:
+        """Yield response content chunks as the LLM generates them"""
+        async for chunk in self.llm.astream(messages):
+            self._last_active_ns = time.monotonic_ns()
+            yield chunk.content
+    
+    @staticmethod
+    def _cache_key(messages: List["BaseMessage"]) -> bytes:
+        """Hash the prompt text of a message list for the response cache"""
+        return hashlib.sha256("".join(m.content for m in messages).encode()).digest()
+    
+    def _get_cached_response(self, key: bytes) -> Optional[str]:
+        """Return a cached response if present and not expired"""
+        entry = self._RESPONSE_CACHE.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, content = entry
+        if time.monotonic() - stored_at > PLATFORM_CONFIG["response_cache_ttl_seconds"]:
+            del self._RESPONSE_CACHE[key]
+            return None
+        
+        self._RESPONSE_CACHE.move_to_end(key)
+        return content
+    
+    def _store_cached_response(self, key: bytes, content: str):
+        """Store a response in the cache, evicting the least recently used entry"""
+        self._RESPONSE_CACHE[key] = (time.monotonic(), content)
+        self._RESPONSE_CACHE.move_to_end(key)
+        while len(self._RESPONSE_CACHE) > PLATFORM_CONFIG["response_cache_size"]:
+            self._RESPONSE_CACHE.popitem(last=False)
+    
+    async def _generate(self, messages: List["BaseMessage"], stream: bool = False) -> str:
+        """Run the LLM on a message list, either streamed or through the shared batcher"""
+        key = self._cache_key(messages)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+        
+        if stream:
+            content = "".join([chunk async for chunk in self.process_task_stream(messages)])
+        else:
+            response = await LLM_BATCHER.submit(messages)
+            content = response.content
+        
+        self._store_cached_response(key, content)
+        return content
+    
+    @classmethod
+    def _system_message(cls) -> "SystemMessage":
+        """Build this agent type's SystemMessage once, on first use"""
+        message = cls.__dict__.get("_cached_system_message")
+        if message is None:
+            from langchain_core.messages import SystemMessage
+            message = SystemMessage(content=cls._SYSTEM_PROMPT)
+            cls._cached_system_message = message
+        return message
+    
+    def _task_prompt(self, task: TaskRecord) -> str:
+        """Fill this agent's task template from a task record"""
+        return self._TASK_TEMPLATE.format(
+            title=task.title,
+            description=task.description,
+            required_capabilities=task.required_capabilities
+        )
+    
+    async def _run_llm_task(self, task: TaskRecord, stream: bool = False) -> str:
+        """Build the prompt for a task from the agent template and run it through the LLM"""
+        from langchain_core.messages import HumanMessage
+        
+        messages = [
+            self._system_message(),
+            HumanMessage(content=self._task_prompt(task))
+        ]
+        return await self._generate(messages, stream)
+    
+    async def submit_batch(self, tasks: List[TaskRecord]) -> str:
+        """Submit latency-tolerant tasks through the offline Batch API and return the batch ID"""
+        requests = [
+            build_batch_request(task.id, [
+                {"role": "system", "content": self.get_system_prompt()},
+                {"role": "user", "content": self._task_prompt(task)}
+            ])
+            for task in tasks
+        ]
+        return await create_batch(requests)
+    
+    async def poll_batch(self, batch_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Return task_id -> wrapped result once a batch completes, or None while it is running"""
+        contents = await fetch_batch_results(batch_id)
+        if contents is None:
+            return None
+        return {task_id: self._wrap_result(content) for task_id, content in contents.items()}
+    
+    async def process_task(self, task: TaskRecord, stream: bool = False) -> Dict[str, Any]:
         """Process a task and return the result"""
+        return self._wrap_result(await self._run_llm_task(task, stream))
+    
+    @abstractmethod
+    def _wrap_result(self, content: str) -> Dict[str, Any]:
+        """Wrap the raw LLM output into this agent's result format"""
         pass
     
     @abstractmethod
@@ -56,92 +285,88 @@ class BaseAgent(ABC):
         """Get the system prompt for this agent type"""
         pass
     
-    async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_task(self, task: TaskRecord, stream: bool = False) -> AgentResult:
         """Execute a task with error handling and metrics tracking"""
-        start_time = time.time()
-        self.current_tasks.append(task["id"])
-        await self.update_status(AgentStatus.BUSY)
+        start_ns = time.monotonic_ns()
+        
+        # Apply backpressure: wait for a free slot, but reject if the agent stays saturated
+        try:
+            await asyncio.wait_for(self._sem.acquire(), PLATFORM_CONFIG["agent_queue_timeout_seconds"])
+        except asyncio.TimeoutError:
+            return AgentResult(
+                status="error",
+                error=f"Agent {self.agent_id} is at capacity ({self.max_concurrent_tasks} concurrent tasks)",
+                completion_time=(time.monotonic_ns() - start_ns) / 1e9,
+                agent_id=self.agent_id
+            )
+        
+        self.current_tasks.add(task.id)
+        self._recompute_load()
+        if len(self.current_tasks) == 1:
+            await self.update_status(AgentStatus.BUSY)
         
         try:
-            result = await self.process_task(task)
+            result = await self.process_task(task, stream)
             
             # Update performance metrics
-            completion_time = time.time() - start_time
-            self.performance_metrics["tasks_completed"] += 1
+            completion_time = (time.monotonic_ns() - start_ns) / 1e9
+            self._tasks_completed += 1
             
-            # Update average completion time
-            prev_avg = self.performance_metrics["average_completion_time"]
-            task_count = self.performance_metrics["tasks_completed"]
-            self.performance_metrics["average_completion_time"] = (
-                (prev_avg * (task_count - 1) + completion_time) / task_count
-            )
+            # Update average completion time (running mean)
+            self._avg_completion_time += (completion_time - self._avg_completion_time) / self._tasks_completed
+            self._update_success_rate(1.0)
             
-            return {
-                "status": "success",
-                "result": result,
-                "completion_time": completion_time,
-                "agent_id": self.agent_id
-            }
+            return AgentResult(
+                status="success",
+                result=result,
+                completion_time=completion_time,
+                agent_id=self.agent_id
+            )
             
         except Exception as e:
             # Update failure metrics
-            self.performance_metrics["success_rate"] *= 0.95  # Slight penalty for failures
+            self._update_success_rate(0.0)
             
-            return {
-                "status": "error",
-                "error": str(e),
-                "completion_time": time.time() - start_time,
-                "agent_id": self.agent_id
-            }
+            return AgentResult(
+                status="error",
+                error=str(e),
+                completion_time=(time.monotonic_ns() - start_ns) / 1e9,
+                agent_id=self.agent_id
+            )
         
         finally:
-            self.current_tasks.remove(task["id"])
+            self.current_tasks.discard(task.id)
+            self._sem.release()
+            self._recompute_load()
             if not self.current_tasks:
                 await self.update_status(AgentStatus.IDLE)
 
 class ResearchAgent(BaseAgent):
     """Agent specialized in research, data analysis, and information gathering"""
     
+    __slots__ = ()
+    
+    _SYSTEM_PROMPT = RESEARCH_SYSTEM_PROMPT
+    _TASK_TEMPLATE = TASK_PROMPT_PREFIX + (
+        "Please complete this research task thoroughly and provide detailed findings."
+    )
+    
     def __init__(self, agent_id: str, name: str):
         super().__init__(
             agent_id=agent_id,
             agent_type="research",
             name=name,
-            capabilities=AGENT_TYPES["research"]["capabilities"]
+            capabilities=_RESEARCH_CAPS,
+            max_concurrent_tasks=_RESEARCH_MAX
         )
     
     def get_system_prompt(self) -> str:
-        return """You are a Research Agent specialized in data analysis, research, and information gathering.
-        Your capabilities include:
-        - Data analysis and interpretation
-        - Web research and fact-checking
-        - Literature reviews and market research
-        - Statistical analysis of datasets
-        - Trend identification and pattern recognition
-        
-        When given a task, provide thorough, well-researched responses with citations and evidence.
-        Focus on accuracy, completeness, and actionable insights."""
+        return self._SYSTEM_PROMPT
     
-    async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Process research-related tasks"""
-        system_prompt = self.get_system_prompt()
-        task_prompt = f"""
-        Task: {task['title']}
-        Description: {task['description']}
-        Required Capabilities: {task['required_capabilities']}
-        
-        Please complete this research task thoroughly and provide detailed findings.
-        """
-        
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=task_prompt)
-        ]
-        
-        response = await asyncio.to_thread(self.llm.invoke, messages)
-        
+    def _wrap_result(self, content: str) -> Dict[str, Any]:
+        """Wrap the LLM output for research-related tasks"""
         return {
-            "findings": response.content,
+            "findings": content,
             "methodology": "AI-powered research and analysis",
             "confidence_score": 0.85,
             "sources": ["AI Knowledge Base"],
@@ -151,47 +376,30 @@ class ResearchAgent(BaseAgent):
 class CodeAgent(BaseAgent):
     """Agent specialized in software development, debugging, and code review"""
     
+    __slots__ = ()
+    
+    _SYSTEM_PROMPT = CODE_SYSTEM_PROMPT
+    _TASK_TEMPLATE = TASK_PROMPT_PREFIX + (
+        "Please complete this coding task with high-quality, production-ready code.\n"
+        "Include comments and documentation as needed."
+    )
+    
     def __init__(self, agent_id: str, name: str):
         super().__init__(
             agent_id=agent_id,
             agent_type="code",
             name=name,
-            capabilities=AGENT_TYPES["code"]["capabilities"]
+            capabilities=_CODE_CAPS,
+            max_concurrent_tasks=_CODE_MAX
         )
     
     def get_system_prompt(self) -> str:
-        return """You are a Code Agent specialized in software development and engineering.
-        Your capabilities include:
-        - Code generation and implementation
-        - Debugging and error resolution
-        - Code review and optimization
-        - Architecture design and planning
-        - Testing and quality assurance
-        
-        When given a coding task, provide clean, efficient, well-documented code.
-        Follow best practices and include error handling where appropriate."""
+        return self._SYSTEM_PROMPT
     
-    async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Process coding-related tasks"""
-        system_prompt = self.get_system_prompt()
-        task_prompt = f"""
-        Task: {task['title']}
-        Description: {task['description']}
-        Required Capabilities: {task['required_capabilities']}
-        
-        Please complete this coding task with high-quality, production-ready code.
-        Include comments and documentation as needed.
-        """
-        
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=task_prompt)
-        ]
-        
-        response = await asyncio.to_thread(self.llm.invoke, messages)
-        
+    def _wrap_result(self, content: str) -> Dict[str, Any]:
+        """Wrap the LLM output for coding-related tasks"""
         return {
-            "code": response.content,
+            "code": content,
             "language": "Python",  # Default, could be detected from task
             "documentation": "Code includes inline comments and documentation",
             "testing_notes": "Unit tests recommended for production use",
@@ -201,47 +409,30 @@ class CodeAgent(BaseAgent):
 class CreativeAgent(BaseAgent):
     """Agent specialized in creative content, design, and problem-solving"""
     
+    __slots__ = ()
+    
+    _SYSTEM_PROMPT = CREATIVE_SYSTEM_PROMPT
+    _TASK_TEMPLATE = TASK_PROMPT_PREFIX + (
+        "Please approach this task with creativity and originality.\n"
+        "Provide engaging, innovative solutions that capture attention."
+    )
+    
     def __init__(self, agent_id: str, name: str):
         super().__init__(
             agent_id=agent_id,
             agent_type="creative",
             name=name,
-            capabilities=AGENT_TYPES["creative"]["capabilities"]
+            capabilities=_CREATIVE_CAPS,
+            max_concurrent_tasks=_CREATIVE_MAX
         )
     
     def get_system_prompt(self) -> str:
-        return """You are a Creative Agent specialized in content creation and creative problem-solving.
-        Your capabilities include:
-        - Content creation and creative writing
-        - Design thinking and ideation
-        - Brainstorming and innovation
-        - Storytelling and narrative development
-        - Creative problem-solving approaches
-        
-        When given a creative task, think outside the box and provide original, engaging content.
-        Focus on creativity, originality, and emotional impact."""
+        return self._SYSTEM_PROMPT
     
-    async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Process creative tasks"""
-        system_prompt = self.get_system_prompt()
-        task_prompt = f"""
-        Task: {task['title']}
-        Description: {task['description']}
-        Required Capabilities: {task['required_capabilities']}
-        
-        Please approach this task with creativity and originality.
-        Provide engaging, innovative solutions that capture attention.
-        """
-        
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=task_prompt)
-        ]
-        
-        response = await asyncio.to_thread(self.llm.invoke, messages)
-        
+    def _wrap_result(self, content: str) -> Dict[str, Any]:
+        """Wrap the LLM output for creative tasks"""
         return {
-            "creative_output": response.content,
+            "creative_output": content,
             "style": "Original and engaging",
             "target_audience": "General audience",
             "creativity_score": 0.88,
@@ -251,47 +442,30 @@ class CreativeAgent(BaseAgent):
 class AnalysisAgent(BaseAgent):
     """Agent specialized in data processing, statistical analysis, and insights"""
     
+    __slots__ = ()
+    
+    _SYSTEM_PROMPT = ANALYSIS_SYSTEM_PROMPT
+    _TASK_TEMPLATE = TASK_PROMPT_PREFIX + (
+        "Please perform thorough analysis and provide statistical insights.\n"
+        "Include key metrics, trends, and actionable recommendations."
+    )
+    
     def __init__(self, agent_id: str, name: str):
         super().__init__(
             agent_id=agent_id,
             agent_type="analysis",
             name=name,
-            capabilities=AGENT_TYPES["analysis"]["capabilities"]
+            capabilities=_ANALYSIS_CAPS,
+            max_concurrent_tasks=_ANALYSIS_MAX
         )
     
     def get_system_prompt(self) -> str:
-        return """You are an Analysis Agent specialized in data processing and statistical analysis.
-        Your capabilities include:
-        - Statistical analysis and data processing
-        - Pattern recognition and trend analysis
-        - Forecasting and predictive modeling
-        - Optimization and performance analysis
-        - Data visualization recommendations
-        
-        When given an analysis task, provide thorough statistical insights with clear interpretations.
-        Focus on accuracy, statistical significance, and actionable recommendations."""
+        return self._SYSTEM_PROMPT
     
-    async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Process analysis tasks"""
-        system_prompt = self.get_system_prompt()
-        task_prompt = f"""
-        Task: {task['title']}
-        Description: {task['description']}
-        Required Capabilities: {task['required_capabilities']}
-        
-        Please perform thorough analysis and provide statistical insights.
-        Include key metrics, trends, and actionable recommendations.
-        """
-        
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=task_prompt)
-        ]
-        
-        response = await asyncio.to_thread(self.llm.invoke, messages)
-        
+    def _wrap_result(self, content: str) -> Dict[str, Any]:
+        """Wrap the LLM output for analysis tasks"""
         return {
-            "analysis_results": response.content,
+            "analysis_results": content,
             "key_metrics": "Statistical measures and KPIs identified",
             "trends": "Patterns and trends analyzed",
             "confidence_interval": "95%",
@@ -301,47 +475,30 @@ class AnalysisAgent(BaseAgent):
 class CommunicationAgent(BaseAgent):
     """Agent specialized in natural language processing, translation, and communication"""
     
+    __slots__ = ()
+    
+    _SYSTEM_PROMPT = COMMUNICATION_SYSTEM_PROMPT
+    _TASK_TEMPLATE = TASK_PROMPT_PREFIX + (
+        "Please handle this communication task with attention to clarity and effectiveness.\n"
+        "Ensure the output is well-structured and appropriate for the intended audience."
+    )
+    
     def __init__(self, agent_id: str, name: str):
         super().__init__(
             agent_id=agent_id,
             agent_type="communication",
             name=name,
-            capabilities=AGENT_TYPES["communication"]["capabilities"]
+            capabilities=_COMMUNICATION_CAPS,
+            max_concurrent_tasks=_COMMUNICATION_MAX
         )
     
     def get_system_prompt(self) -> str:
-        return """You are a Communication Agent specialized in language processing and communication.
-        Your capabilities include:
-        - Text summarization and synthesis
-        - Translation and localization
-        - Sentiment analysis and tone detection
-        - Communication drafting and editing
-        - Language processing and understanding
-        
-        When given a communication task, focus on clarity, tone, and effectiveness.
-        Ensure messages are well-structured and appropriate for the target audience."""
+        return self._SYSTEM_PROMPT
     
-    async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Process communication tasks"""
-        system_prompt = self.get_system_prompt()
-        task_prompt = f"""
-        Task: {task['title']}
-        Description: {task['description']}
-        Required Capabilities: {task['required_capabilities']}
-        
-        Please handle this communication task with attention to clarity and effectiveness.
-        Ensure the output is well-structured and appropriate for the intended audience.
-        """
-        
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=task_prompt)
-        ]
-        
-        response = await asyncio.to_thread(self.llm.invoke, messages)
-        
+    def _wrap_result(self, content: str) -> Dict[str, Any]:
+        """Wrap the LLM output for communication tasks"""
         return {
-            "communication_output": response.content,
+            "communication_output": content,
             "tone": "Professional and clear",
             "readability_score": 0.85,
             "target_audience": "General professional audience",
@@ -349,17 +506,18 @@ class CommunicationAgent(BaseAgent):
         }
 
 # Agent Factory
+_AGENT_CLASSES: Mapping[str, Type[BaseAgent]] = MappingProxyType({
+    "research": ResearchAgent,
+    "code": CodeAgent,
+    "creative": CreativeAgent,
+    "analysis": AnalysisAgent,
+    "communication": CommunicationAgent
+})
+
 def create_agent(agent_type: str, agent_id: str, name: str) -> BaseAgent:
     """Factory function to create agents of different types"""
-    agent_classes = {
-        "research": ResearchAgent,
-        "code": CodeAgent,
-        "creative": CreativeAgent,
-        "analysis": AnalysisAgent,
-        "communication": CommunicationAgent
-    }
-    
-    if agent_type not in agent_classes:
+    agent_class = _AGENT_CLASSES.get(agent_type)
+    if agent_class is None:
         raise ValueError(f"Unknown agent type: {agent_type}")
     
-    return agent_classes[agent_type](agent_id, name)
+    return agent_class(agent_id, name)
@@ -0,0 +1,81 @@
+"""
+Batch API client for the Multi-Agent Orchestration Platform
+Submits latency-tolerant workloads as an offline chat-completions batch
+"""
+import json
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+
+from config import LLM_CONFIG, HTTP_ASYNC_CLIENT
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+
+_client: Optional["AsyncOpenAI"] = None
+
+
+def get_batch_client() -> "AsyncOpenAI":
+    """Create the OpenAI client used for batch jobs on first use"""
+    global _client
+    if _client is None:
+        from openai import AsyncOpenAI
+        
+        _client = AsyncOpenAI(
+            base_url=LLM_CONFIG["base_url"],
+            api_key=LLM_CONFIG["api_key"],
+            http_client=HTTP_ASYNC_CLIENT
+        )
+    return _client
+
+
+def build_batch_request(custom_id: str, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Build a single JSONL request line for the batch input file"""
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": LLM_CONFIG["model"],
+            "messages": messages,
+            "temperature": LLM_CONFIG["temperature"],
+            "max_tokens": LLM_CONFIG["max_tokens"]
+        }
+    }
+
+
+async def create_batch(requests: List[Dict[str, Any]]) -> str:
+    """Upload batch requests as a JSONL file and start a batch job, returning its ID"""
+    client = get_batch_client()
+    payload = "\n".join(json.dumps(request) for request in requests).encode()
+
+    input_file = await client.files.create(file=("batch_input.jsonl", payload), purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW
+    )
+    return batch.id
+
+
+async def fetch_batch_results(batch_id: str) -> Optional[Dict[str, str]]:
+    """Return custom_id -> response content once the batch completes, or None if still running"""
+    client = get_batch_client()
+    batch = await client.batches.retrieve(batch_id)
+
+    if batch.status in ("failed", "expired", "cancelled"):
+        raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+    if batch.status != "completed":
+        return None
+
+    output = await client.files.content(batch.output_file_id)
+    results = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        body = (record.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        results[record["custom_id"]] = choices[0]["message"]["content"] if choices else ""
+    return results
@@ -1,10 +1,16 @@
 """
 Configuration settings for the Multi-Agent Orchestration Platform
 """
+import functools
 import os
-from typing import Dict, Any
+import ssl
+from typing import TYPE_CHECKING, Dict, Any
 import httpx
-from langchain_openai import ChatOpenAI
+
+from llm_batcher import LLMBatcher
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 # LLM Configuration
 LLM_CONFIG = {
@@ -15,20 +21,35 @@ LLM_CONFIG = {
     "max_tokens": 2000
 }
 
-# Create HTTP client with SSL verification disabled
-HTTP_CLIENT = httpx.Client(verify=False)
+# HTTP client settings: TLS verification on, HTTP/2 multiplexing and pooled keep-alive connections.
+# Set LLM_CA_BUNDLE to a PEM file if the LLM endpoint uses a private CA.
+LLM_CA_BUNDLE = os.getenv("LLM_CA_BUNDLE")
+HTTP_VERIFY = ssl.create_default_context(cafile=LLM_CA_BUNDLE) if LLM_CA_BUNDLE else True
+HTTP_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+HTTP_CLIENT = httpx.Client(http2=True, verify=HTTP_VERIFY, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+HTTP_ASYNC_CLIENT = httpx.AsyncClient(http2=True, verify=HTTP_VERIFY, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
 
-def get_llm_instance(temperature: float = 0.7, max_tokens: int = 2000) -> ChatOpenAI:
-    """Create and return a configured LLM instance"""
+@functools.lru_cache(maxsize=16)
+def get_llm_instance(temperature: float = 0.7, max_tokens: int = 2000) -> "ChatOpenAI":
+    """Create and return a configured LLM instance, shared per (temperature, max_tokens)"""
+    # Imported lazily: langchain_openai is slow to import and only needed once an LLM is used
+    from langchain_openai import ChatOpenAI
+    
     return ChatOpenAI(
         base_url=LLM_CONFIG["base_url"],
         model=LLM_CONFIG["model"],
         api_key=LLM_CONFIG["api_key"],
         http_client=HTTP_CLIENT,
+        http_async_client=HTTP_ASYNC_CLIENT,
         temperature=temperature,
         max_tokens=max_tokens
     )
 
+# Shared batcher that coalesces concurrent agent LLM calls
+LLM_BATCHER = LLMBatcher(get_llm_instance)
+
 # Agent Types and Capabilities
 AGENT_TYPES = {
     "research": {
@@ -68,6 +89,10 @@ AGENT_TYPES = {
     }
 }
 
+# Freeze capability lists so agents can do O(1) membership checks
+for _agent_config in AGENT_TYPES.values():
+    _agent_config["capabilities"] = frozenset(_agent_config["capabilities"])
+
 # Task Categories and Required Capabilities
 TASK_CATEGORIES = {
     "research_task": ["data_analysis", "web_research", "fact_checking"],
@@ -83,9 +108,21 @@ PLATFORM_CONFIG = {
     "max_agents_per_type": 3,
     "task_timeout_seconds": 300,
     "max_retries": 3,
+    "agent_queue_timeout_seconds": 30,
     "consensus_threshold": 0.7,
+    "success_rate_alpha": 0.05,
+    "wait_time_ema_alpha": 0.1,
+    "load_alpha_tune_interval": 16,
     "load_balance_interval": 30,
-    "monitoring_interval": 10
+    "monitoring_interval": 10,
+    "recent_tasks_window": 1000,
+    "archived_task_cache_size": 1024,
+    "max_message_history": 10000,
+    "response_cache_size": 4096,
+    "response_cache_ttl_seconds": 3600,
+    "db_flush_max_batch": 128,
+    "db_flush_interval_ms": 20,
+    "status_cache_ttl_ms": 500
 }
 
 # Database Configuration
@@ -94,6 +131,8 @@ DATABASE_URL = "sqlite:///./orchestration_platform.db"
 # Dashboard Configuration
 DASHBOARD_CONFIG = {
     "update_interval_ms": 1000,
+    "max_update_interval_ms": 8000,
+    "broadcast_coalesce_ms": 20,
     "max_log_entries": 1000,
     "chart_data_points": 50
 }
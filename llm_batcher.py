@@ -0,0 +1,83 @@
+"""
+Client-side request batching for the Multi-Agent Orchestration Platform
+Coalesces concurrent LLM calls from agents into a single abatch request
+"""
+import asyncio
+from typing import TYPE_CHECKING, Callable, List, Any, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+    from langchain_core.messages import AIMessage, BaseMessage
+
+
+class LLMBatcher:
+    """Collect concurrent LLM requests within a short window and flush them together"""
+
+    def __init__(self, llm_factory: Callable[[], "ChatOpenAI"], max_batch: int = 32, wait_ms: int = 8):
+        self._llm_factory = llm_factory
+        self._llm: Optional["ChatOpenAI"] = None
+        self.max_batch = max_batch
+        self.wait_ms = wait_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Flushes still waiting on abatch; held so they are not garbage-collected mid-flight
+        self._inflight: Set[asyncio.Task] = set()
+
+    @property
+    def llm(self) -> "ChatOpenAI":
+        """LLM instance used for batches, created on first use"""
+        if self._llm is None:
+            self._llm = self._llm_factory()
+        return self._llm
+
+    def _ensure_worker(self):
+        """Start the background flush loop on first use"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def submit(self, messages: List["BaseMessage"]) -> "AIMessage":
+        """Queue a message list for the next batch and wait for its response"""
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((messages, future))
+        return await future
+
+    async def _run(self):
+        """Background loop that drains the queue into batched LLM calls"""
+        while True:
+            items: List[Tuple[List["BaseMessage"], asyncio.Future]] = [await self._queue.get()]
+
+            # Give concurrent callers a short window to join this batch
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.wait_ms / 1000
+            while len(items) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Flush in the background so the next batch can be collected and sent meanwhile
+            flush = asyncio.create_task(self._flush(items))
+            self._inflight.add(flush)
+            flush.add_done_callback(self._inflight.discard)
+
+    async def _flush(self, items: List[Tuple[List["BaseMessage"], asyncio.Future]]):
+        """Send one batched request and resolve each caller's future"""
+        try:
+            results: List[Any] = await self.llm.abatch(
+                [messages for messages, _ in items], return_exceptions=True
+            )
+        except Exception as e:
+            results = [e] * len(items)
+
+        for (_, future), result in zip(items, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -3,21 +3,46 @@ Main FastAPI application for the Multi-Agent Orchestration Platform
 Provides REST API endpoints and WebSocket connections for real-time dashboard
 """
 import asyncio
-import json
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+import importlib.util
+import itertools
+import msgspec
+import orjson
+import warnings
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Set
 from contextlib import asynccontextmanager
+from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request, WebSocket
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
 
 from orchestrator import OrchestrationEngine
 from models import TaskCreate, TaskResponse, AgentResponse, SystemMetricsResponse
 from config import DASHBOARD_CONFIG
 
+# C-accelerated server components expected by uvicorn.run below
+def _module_available(name: str) -> bool:
+    """Whether a module can be imported; a missing parent package counts as unavailable"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+_MISSING_SPEEDUPS = [
+    name for name in ("uvloop", "httptools", "websockets.speedups")
+    if not _module_available(name)
+]
+if _MISSING_SPEEDUPS:
+    warnings.warn(
+        f"C speedups not available: {', '.join(_MISSING_SPEEDUPS)}; "
+        "install uvicorn[standard] (and a websockets wheel with its C extension) for full performance",
+        RuntimeWarning
+    )
+
 # Global orchestration engine instance
 orchestrator = None
 
@@ -35,15 +60,16 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
-    # Clean up resources if needed
-    pass
+    # Commit any task and message writes still waiting in the flush queue, then stop the flusher
+    await orchestrator.close()
 
 # Create FastAPI app
 app = FastAPI(
     title="Multi-Agent Orchestration Platform",
     description="Coordinate multiple AI agents to collaboratively solve complex problems",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -55,474 +81,186 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses such as the dashboard page
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Static dashboard assets
+STATIC_DIR = Path(__file__).parent / "static"
+DASHBOARD_HTML = STATIC_DIR / "dashboard.html"
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+
+# The dashboard page never changes at runtime, so read it once at startup
+_DASHBOARD_HTML_BYTES: bytes = DASHBOARD_HTML.read_bytes()
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        self._has_clients = asyncio.Event()
+        self._pending_events: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        self._has_clients.set()
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        if not self.active_connections:
+            self._has_clients.clear()
+
+    async def wait_for_clients(self):
+        """Block until at least one WebSocket client is connected"""
+        await self._has_clients.wait()
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                # Remove disconnected connections
-                self.active_connections.remove(connection)
+    async def broadcast(self, payload: bytes):
+        # Send the pre-encoded payload to all clients concurrently, then drop the ones that failed
+        connections = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for connection in connections),
+            return_exceptions=True
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
+
+    def enqueue(self, event: Dict[str, Any]):
+        """Queue an event to be sent with any others raised within the coalescing window"""
+        if not self.active_connections:
+            return
+        self._pending_events.append(event)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_events())
+
+    async def _flush_events(self):
+        """Wait out the coalescing window, then broadcast all queued events as one frame"""
+        try:
+            # Events queued while a broadcast is awaiting go out in the next frame of this loop
+            while self._pending_events:
+                await asyncio.sleep(DASHBOARD_CONFIG["broadcast_coalesce_ms"] / 1000)
+                events, self._pending_events = self._pending_events, []
+                await self.broadcast(orjson.dumps({
+                    "type": "batch",
+                    "events": events
+                }, option=orjson.OPT_UTC_Z))
+        finally:
+            self._flush_task = None
 
 manager = ConnectionManager()
 
 # Background monitoring task
 async def monitor_system():
     """Background task to monitor system and broadcast updates"""
+    base_interval = DASHBOARD_CONFIG["update_interval_ms"]
+    interval = base_interval
+    last_version = None
+    payload = b""
     while True:
+        # Stay idle while nobody is watching the dashboard
+        await manager.wait_for_clients()
         try:
             if orchestrator and manager.active_connections:
-                status = orchestrator.get_system_status()
-                await manager.broadcast(json.dumps({
-                    "type": "system_update",
-                    "data": status,
-                    "timestamp": datetime.utcnow().isoformat()
-                }))
+                # Only rebuild the snapshot when orchestrator state has changed,
+                # and back off the tick rate while the system stays quiet
+                if orchestrator.state_version != last_version:
+                    last_version = orchestrator.state_version
+                    interval = base_interval
+                    status = orchestrator.get_system_status()
+                    payload = orjson.dumps({
+                        "type": "system_update",
+                        "data": status,
+                        "timestamp": datetime.now(timezone.utc)
+                    }, option=orjson.OPT_UTC_Z)
+                else:
+                    interval = min(interval * 2, DASHBOARD_CONFIG["max_update_interval_ms"])
+                await manager.broadcast(payload)
         except Exception as e:
             print(f"Monitoring error: {e}")
         
-        await asyncio.sleep(DASHBOARD_CONFIG["update_interval_ms"] / 1000)
+        await asyncio.sleep(interval / 1000)
 
 # API Endpoints
 
-@app.get("/", response_class=HTMLResponse)
+@app.get("/", response_class=Response)
 async def get_dashboard():
     """Serve the main dashboard"""
-    return """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Multi-Agent Orchestration Platform</title>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1">
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body { 
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                padding: 20px;
-            }
-            .container { 
-                max-width: 1400px; 
-                margin: 0 auto;
-                background: white;
-                border-radius: 15px;
-                box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-                overflow: hidden;
-            }
-            .header { 
-                background: linear-gradient(135deg, #2c3e50, #34495e);
-                color: white; 
-                padding: 30px;
-                text-align: center;
-            }
-            .header h1 { 
-                font-size: 2.5em; 
-                margin-bottom: 10px;
-                font-weight: 300;
-            }
-            .header p { 
-                font-size: 1.1em; 
-                opacity: 0.9;
-            }
-            .dashboard { 
-                display: grid; 
-                grid-template-columns: 1fr 1fr 1fr; 
-                gap: 20px; 
-                padding: 30px;
-            }
-            .card { 
-                background: #f8f9fa; 
-                border-radius: 10px; 
-                padding: 25px;
-                box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-                transition: transform 0.3s ease;
-            }
-            .card:hover { 
-                transform: translateY(-5px);
-                box-shadow: 0 10px 25px rgba(0,0,0,0.15);
-            }
-            .card h3 { 
-                color: #2c3e50; 
-                margin-bottom: 15px;
-                font-size: 1.3em;
-            }
-            .metric { 
-                display: flex; 
-                justify-content: space-between; 
-                margin: 10px 0;
-                padding: 8px 0;
-                border-bottom: 1px solid #e9ecef;
-            }
-            .metric:last-child { border-bottom: none; }
-            .metric-value { 
-                font-weight: bold; 
-                color: #495057;
-            }
-            .status-indicator { 
-                display: inline-block; 
-                width: 12px; 
-                height: 12px; 
-                border-radius: 50%; 
-                margin-right: 8px;
-            }
-            .status-active { background-color: #28a745; }
-            .status-busy { background-color: #ffc107; }
-            .status-idle { background-color: #6c757d; }
-            .status-offline { background-color: #dc3545; }
-            .task-form { 
-                grid-column: span 3; 
-                background: #e3f2fd; 
-                border-radius: 10px; 
-                padding: 25px;
-                margin-top: 20px;
-            }
-            .form-group { 
-                margin-bottom: 20px;
-            }
-            .form-group label { 
-                display: block; 
-                margin-bottom: 8px; 
-                font-weight: 600;
-                color: #2c3e50;
-            }
-            .form-group input, .form-group textarea, .form-group select { 
-                width: 100%; 
-                padding: 12px; 
-                border: 2px solid #dee2e6;
-                border-radius: 8px; 
-                font-size: 14px;
-                transition: border-color 0.3s ease;
-            }
-            .form-group input:focus, .form-group textarea:focus, .form-group select:focus { 
-                outline: none; 
-                border-color: #667eea;
-                box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-            }
-            .btn { 
-                background: linear-gradient(135deg, #667eea, #764ba2);
-                color: white; 
-                padding: 12px 30px; 
-                border: none; 
-                border-radius: 8px; 
-                cursor: pointer; 
-                font-size: 16px;
-                font-weight: 600;
-                transition: all 0.3s ease;
-            }
-            .btn:hover { 
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-            }
-            .agent-list { 
-                max-height: 300px; 
-                overflow-y: auto;
-            }
-            .agent-item { 
-                display: flex; 
-                align-items: center; 
-                padding: 10px 0;
-                border-bottom: 1px solid #e9ecef;
-            }
-            .agent-item:last-child { border-bottom: none; }
-            .agent-name { 
-                flex: 1; 
-                font-weight: 500;
-            }
-            .agent-type { 
-                color: #6c757d; 
-                font-size: 0.9em;
-                margin-left: 10px;
-            }
-            .log-container { 
-                max-height: 200px; 
-                overflow-y: auto; 
-                background: #f8f9fa; 
-                border-radius: 5px; 
-                padding: 15px;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-            .log-entry { 
-                margin: 5px 0; 
-                padding: 5px;
-                border-left: 3px solid #667eea;
-                background: white;
-                border-radius: 3px;
-            }
-            @media (max-width: 768px) {
-                .dashboard { 
-                    grid-template-columns: 1fr; 
-                }
-                .task-form { 
-                    grid-column: span 1; 
-                }
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🤖 Multi-Agent Orchestration Platform</h1>
-                <p>Coordinate AI agents to solve complex problems collaboratively</p>
-            </div>
-            
-            <div class="dashboard">
-                <div class="card">
-                    <h3>📊 System Metrics</h3>
-                    <div id="system-metrics">
-                        <div class="metric">
-                            <span>Total Tasks:</span>
-                            <span class="metric-value" id="total-tasks">0</span>
-                        </div>
-                        <div class="metric">
-                            <span>Completed:</span>
-                            <span class="metric-value" id="completed-tasks">0</span>
-                        </div>
-                        <div class="metric">
-                            <span>Active:</span>
-                            <span class="metric-value" id="active-tasks">0</span>
-                        </div>
-                        <div class="metric">
-                            <span>Failed:</span>
-                            <span class="metric-value" id="failed-tasks">0</span>
-                        </div>
-                        <div class="metric">
-                            <span>System Load:</span>
-                            <span class="metric-value" id="system-load">0%</span>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="card">
-                    <h3>🤖 Active Agents</h3>
-                    <div id="agent-list" class="agent-list">
-                        <!-- Agents will be populated here -->
-                    </div>
-                </div>
-                
-                <div class="card">
-                    <h3>💬 Recent Activity</h3>
-                    <div id="activity-log" class="log-container">
-                        <!-- Activity logs will appear here -->
-                    </div>
-                </div>
-                
-                <div class="task-form">
-                    <h3>🎯 Submit New Task</h3>
-                    <form id="task-form">
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
-                            <div class="form-group">
-                                <label for="task-title">Task Title:</label>
-                                <input type="text" id="task-title" name="title" required 
-                                       placeholder="Enter a descriptive task title">
-                            </div>
-                            <div class="form-group">
-                                <label for="task-type">Task Type:</label>
-                                <select id="task-type" name="task_type">
-                                    <option value="research_task">Research Task</option>
-                                    <option value="development_task">Development Task</option>
-                                    <option value="creative_task">Creative Task</option>
-                                    <option value="analysis_task">Analysis Task</option>
-                                    <option value="communication_task">Communication Task</option>
-                                    <option value="complex_task">Complex Task</option>
-                                </select>
-                            </div>
-                        </div>
-                        <div class="form-group">
-                            <label for="task-description">Description:</label>
-                            <textarea id="task-description" name="description" rows="4" required
-                                      placeholder="Provide detailed task description and requirements"></textarea>
-                        </div>
-                        <div class="form-group">
-                            <label for="task-capabilities">Required Capabilities (comma-separated):</label>
-                            <input type="text" id="task-capabilities" name="required_capabilities" required
-                                   placeholder="e.g., data_analysis, code_generation, creative_writing">
-                        </div>
-                        <button type="submit" class="btn">🚀 Submit Task</button>
-                    </form>
-                </div>
-            </div>
-        </div>
-
-        <script>
-            // WebSocket connection for real-time updates
-            const ws = new WebSocket(`ws://${window.location.host}/ws`);
-            
-            ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
-                if (data.type === 'system_update') {
-                    updateDashboard(data.data);
-                }
-            };
-            
-            ws.onopen = function(event) {
-                addLogEntry('Connected to orchestration platform');
-            };
-            
-            ws.onclose = function(event) {
-                addLogEntry('Disconnected from platform');
-            };
-            
-            // Update dashboard with real-time data
-            function updateDashboard(data) {
-                // Update system metrics
-                document.getElementById('total-tasks').textContent = data.system_metrics.total_tasks || 0;
-                document.getElementById('completed-tasks').textContent = data.system_metrics.completed_tasks || 0;
-                document.getElementById('active-tasks').textContent = data.active_tasks || 0;
-                document.getElementById('failed-tasks').textContent = data.system_metrics.failed_tasks || 0;
-                document.getElementById('system-load').textContent = Math.round((data.system_metrics.system_load || 0) * 100) + '%';
-                
-                // Update agent list
-                const agentList = document.getElementById('agent-list');
-                agentList.innerHTML = '';
-                
-                Object.entries(data.agent_status || {}).forEach(([agentId, agent]) => {
-                    const agentItem = document.createElement('div');
-                    agentItem.className = 'agent-item';
-                    
-                    const statusClass = `status-${agent.status}`;
-                    agentItem.innerHTML = `
-                        <span class="status-indicator ${statusClass}"></span>
-                        <span class="agent-name">${agent.name}</span>
-                        <span class="agent-type">${agent.type} (${agent.current_load}/${agent.max_load})</span>
-                    `;
-                    agentList.appendChild(agentItem);
-                });
-            }
-            
-            // Add log entry
-            function addLogEntry(message) {
-                const logContainer = document.getElementById('activity-log');
-                const logEntry = document.createElement('div');
-                logEntry.className = 'log-entry';
-                logEntry.innerHTML = `<strong>${new Date().toLocaleTimeString()}</strong>: ${message}`;
-                logContainer.appendChild(logEntry);
-                logContainer.scrollTop = logContainer.scrollHeight;
-                
-                // Keep only last 50 entries
-                while (logContainer.children.length > 50) {
-                    logContainer.removeChild(logContainer.firstChild);
-                }
-            }
-            
-            // Handle task form submission
-            document.getElementById('task-form').addEventListener('submit', async function(e) {
-                e.preventDefault();
-                
-                const formData = new FormData(e.target);
-                const taskData = {
-                    title: formData.get('title'),
-                    description: formData.get('description'),
-                    task_type: formData.get('task_type'),
-                    required_capabilities: formData.get('required_capabilities').split(',').map(s => s.trim())
-                };
-                
-                try {
-                    const response = await fetch('/api/tasks', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify(taskData)
-                    });
-                    
-                    if (response.ok) {
-                        const result = await response.json();
-                        addLogEntry(`Task submitted: ${taskData.title} (ID: ${result.task_id})`);
-                        e.target.reset();
-                    } else {
-                        const error = await response.json();
-                        addLogEntry(`Error submitting task: ${error.detail}`);
-                    }
-                } catch (error) {
-                    addLogEntry(`Error: ${error.message}`);
-                }
-            });
-            
-            // Initial load
-            addLogEntry('Dashboard initialized');
-        </script>
-    </body>
-    </html>
-    """
+    # A fresh Response per request: middleware such as GZip rewrites response headers in place
+    return Response(content=_DASHBOARD_HTML_BYTES, media_type="text/html")
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time dashboard updates"""
     await manager.connect(websocket)
     try:
+        # Client messages are ignored, so read raw frames without decoding them
         while True:
-            data = await websocket.receive_text()
-            # Handle any client messages if needed
-    except WebSocketDisconnect:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
         manager.disconnect(websocket)
 
 @app.post("/api/tasks")
-async def submit_task(task: TaskCreate, background_tasks: BackgroundTasks):
+async def submit_task(request: Request):
     """Submit a new task to the orchestration system"""
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestration engine not initialized")
     
+    # Decode and validate the body in one pass instead of going through a Pydantic model
+    try:
+        task = msgspec.json.decode(await request.body(), type=TaskCreate)
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
-        task_data = task.dict()
-        task_id = await orchestrator.submit_task(task_data)
+        task_id = await orchestrator.submit_task(task)
         
         # Broadcast task submission
-        await manager.broadcast(json.dumps({
+        manager.enqueue({
             "type": "task_submitted",
             "data": {"task_id": task_id, "title": task.title},
-            "timestamp": datetime.utcnow().isoformat()
-        }))
+            "timestamp": datetime.now(timezone.utc)
+        })
         
         return {"task_id": task_id, "status": "submitted"}
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/tasks/{task_id}")
+@app.get("/api/tasks/{task_id}", response_model=None)
 async def get_task(task_id: str):
     """Get task details by ID"""
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestration engine not initialized")
     
-    task = orchestrator.tasks.get(task_id)
+    task = orchestrator.get_task(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    return task
+    # Encode the public view directly, skipping FastAPI's response encoding pass
+    return Response(msgspec.json.encode(task.to_public()), media_type="application/json")
 
-@app.get("/api/tasks")
+@app.get("/api/tasks", response_model=None)
 async def list_tasks(status: Optional[str] = None, limit: int = 50):
     """List all tasks with optional status filter"""
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestration engine not initialized")
     
-    tasks = list(orchestrator.tasks.values())
-    
+    # Walk the pre-built indexes newest first instead of scanning every task
     if status:
-        tasks = [task for task in tasks if task["status"] == status]
-    
-    # Sort by creation date (newest first) and limit results
-    tasks.sort(key=lambda x: x["created_at"], reverse=True)
-    return tasks[:limit]
+        tasks = reversed(orchestrator.tasks_by_status.get(status, {}).values())
+    else:
+        tasks = reversed(orchestrator.recent_tasks)
+    page = [task.to_public() for task in itertools.islice(tasks, limit)]
+    return Response(msgspec.json.encode(page), media_type="application/json")
 
-@app.get("/api/agents")
+@app.get("/api/agents", response_model=None)
 async def list_agents():
     """List all agents and their status"""
     if not orchestrator:
@@ -535,13 +273,13 @@ async def list_agents():
             "name": agent.name,
             "type": agent.agent_type,
             "status": agent.status,
-            "capabilities": agent.capabilities,
+            "capabilities": sorted(agent.capabilities),
             "current_load": len(agent.current_tasks),
             "max_concurrent_tasks": agent.max_concurrent_tasks,
             "performance_metrics": agent.performance_metrics
         })
     
-    return agents
+    return ORJSONResponse(agents)
 
 @app.get("/api/system/status")
 async def get_system_status():
@@ -577,7 +315,7 @@ async def get_messages(limit: int = 50):
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestration engine not initialized")
     
-    messages = orchestrator.messages[-limit:] if orchestrator.messages else []
+    messages = orchestrator.get_recent_messages(limit)
     return messages
 
 # Health check endpoint
@@ -586,7 +324,7 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc),
         "orchestrator_initialized": orchestrator is not None
     }
 
@@ -595,6 +333,10 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=1,  # Orchestrator state is in-process; see README "Deployment Notes"
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        reload=False,
         log_level="info"
     )
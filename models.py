@@ -8,6 +8,7 @@ from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean,
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from pydantic import BaseModel, Field
+import msgspec
 import uuid
 
 Base = declarative_base()
@@ -65,7 +66,7 @@ class Task(Base):
     task_type = Column(String, nullable=False)
     required_capabilities = Column(JSON)
     priority = Column(Integer, default=1)
-    status = Column(String, default=TaskStatus.PENDING)
+    status = Column(String, default=TaskStatus.PENDING, index=True)
     assigned_agent_id = Column(String, ForeignKey("agents.id"), nullable=True)
     result = Column(Text, nullable=True)
     error_message = Column(Text, nullable=True)
@@ -79,7 +80,7 @@ class Task(Base):
     deadline = Column(DateTime, nullable=True)
     
     # Parent-child relationship for task decomposition
-    parent_task_id = Column(String, ForeignKey("tasks.id"), nullable=True)
+    parent_task_id = Column(String, ForeignKey("tasks.id"), nullable=True, index=True)
     parent_task = relationship("Task", remote_side="Task.id", back_populates="subtasks")
     subtasks = relationship("Task", back_populates="parent_task")
     
@@ -97,7 +98,7 @@ class Message(Base):
     message_type = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     message_metadata = Column(JSON, nullable=True)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
     is_read = Column(Boolean, default=False)
     
     # Relationships
@@ -119,6 +120,96 @@ class SystemMetrics(Base):
     system_load = Column(Float, default=0.0)
     throughput = Column(Float, default=0.0)
 
+# msgspec Structs for hot-path requests and results
+class AgentResult(msgspec.Struct, frozen=True):
+    """Outcome of an agent executing a task"""
+    status: str
+    completion_time: float
+    agent_id: str
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+class TaskRecord(msgspec.Struct, kw_only=True):
+    """In-memory state of a task held by the orchestration engine"""
+    id: str
+    title: str
+    description: str
+    task_type: str
+    required_capabilities: List[str]
+    priority: int = 1
+    status: str = TaskStatus.PENDING
+    created_at: Optional[datetime] = None
+    deadline: Optional[datetime] = None
+    parent_task_id: Optional[str] = None
+    subtask_index: Optional[int] = None
+    subtasks: List[str] = msgspec.field(default_factory=list)
+    assigned_agent_id: Optional[str] = None
+    result: Any = None
+    error_message: Optional[str] = None
+    progress_percentage: float = 0.0
+    assigned_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    actual_duration: Optional[float] = None
+    retry_count: int = 0
+    pending_children: Optional[int] = None
+    child_results: Optional[List[Any]] = None
+
+    def to_public(self) -> "TaskView":
+        """Copy of the fields the task API exposes, leaving out scheduling bookkeeping"""
+        return TaskView(
+            id=self.id,
+            title=self.title,
+            description=self.description,
+            task_type=self.task_type,
+            required_capabilities=self.required_capabilities,
+            priority=self.priority,
+            status=self.status,
+            created_at=self.created_at,
+            deadline=self.deadline,
+            parent_task_id=self.parent_task_id,
+            subtasks=self.subtasks,
+            assigned_agent_id=self.assigned_agent_id,
+            result=self.result,
+            error_message=self.error_message,
+            progress_percentage=self.progress_percentage,
+            assigned_at=self.assigned_at,
+            started_at=self.started_at,
+            completed_at=self.completed_at,
+            actual_duration=self.actual_duration
+        )
+
+class TaskView(msgspec.Struct, kw_only=True):
+    """Public shape of a task returned by the task endpoints"""
+    id: str
+    title: str
+    description: str
+    task_type: str
+    required_capabilities: List[str]
+    priority: int
+    status: str
+    created_at: Optional[datetime]
+    deadline: Optional[datetime]
+    parent_task_id: Optional[str]
+    subtasks: List[str]
+    assigned_agent_id: Optional[str]
+    result: Any
+    error_message: Optional[str]
+    progress_percentage: float
+    assigned_at: Optional[datetime]
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    actual_duration: Optional[float]
+
+class TaskCreate(msgspec.Struct):
+    """Task submission payload, decoded straight from the request body"""
+    title: str
+    description: str
+    task_type: str
+    required_capabilities: List[str]
+    priority: int = 1
+    deadline: Optional[datetime] = None
+
 # Pydantic Models for API
 class AgentCreate(BaseModel):
     agent_type: str
@@ -142,14 +233,6 @@ class AgentResponse(BaseModel):
     created_at: datetime
     last_active: datetime
 
-class TaskCreate(BaseModel):
-    title: str
-    description: str
-    task_type: str
-    required_capabilities: List[str]
-    priority: int = 1
-    deadline: Optional[datetime] = None
-
 class TaskResponse(BaseModel):
     id: str
     title: str
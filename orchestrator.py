@@ -3,18 +3,27 @@ Multi-Agent Orchestration Engine
 Handles task decomposition, delegation, inter-agent communication, and conflict resolution
 """
 import asyncio
+import functools
+import hashlib
+import heapq
+import itertools
 import json
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
+from typing import Deque, Dict, Iterator, List, Any, Optional, Set, Tuple, Union
+from collections import OrderedDict, defaultdict, deque
 import logging
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+import msgspec
+import orjson
+from sqlalchemy import create_engine, event, func, insert, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import load_only, noload, sessionmaker
 
 from agents import BaseAgent, create_agent
-from models import TaskStatus, AgentStatus, MessageType, Base, Task, Agent, Message
-from config import AGENT_TYPES, TASK_CATEGORIES, PLATFORM_CONFIG, get_llm_instance
+from models import TaskStatus, AgentStatus, MessageType, Base, Task, Agent, Message, TaskCreate, TaskRecord
+from config import AGENT_TYPES, TASK_CATEGORIES, PLATFORM_CONFIG, LLM_BATCHER, get_llm_instance
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,31 +32,237 @@ logger = logging.getLogger(__name__)
 # Database setup
 DATABASE_URL = "sqlite:///./orchestration.db"
 engine = create_engine(DATABASE_URL, echo=False)
+
+# Write-optimized SQLite settings: WAL lets readers proceed during commits and
+# synchronous=NORMAL drops the per-commit fsync that WAL makes unnecessary
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=3000",
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to every new DB-API connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Statements for the background DB flusher, built once and executed with many rows per batch.
+# Task saves upsert by primary key; the original created_at is kept on conflict.
+_task_insert = sqlite_insert(Task.__table__)
+TASK_UPSERT = _task_insert.on_conflict_do_update(
+    index_elements=[Task.__table__.c.id],
+    set_={
+        column: _task_insert.excluded[column]
+        for column in (
+            "title", "description", "task_type", "required_capabilities",
+            "status", "priority", "assigned_agent_id", "result"
+        )
+    }
+)
+MESSAGE_INSERT = insert(Message.__table__)
+
+# Orchestrator prompts. The fixed instructions come first and the task fields last,
+# so consecutive calls share a byte-identical prefix that the serving side can reuse
+# from its prompt/KV cache instead of prefilling it again.
+NEEDS_DECOMPOSITION_PROMPT = """
+        Analyze the task below and determine if it needs to be broken down into subtasks.
+        
+        Consider:
+        1. Task complexity and scope
+        2. Multiple capability requirements
+        3. Potential for parallel execution
+        
+        Respond with JSON: {{"needs_decomposition": true/false, "reasoning": "explanation"}}
+        
+        Title: {title}
+        Description: {description}
+        Required Capabilities: {required_capabilities}
+        """
+
+DECOMPOSITION_PROMPT = """
+        Decompose the complex task below into smaller, manageable subtasks.
+        
+        Create subtasks that:
+        1. Can be executed independently or with minimal dependencies
+        2. Each require specific capabilities
+        3. Together accomplish the main task
+        
+        Respond with JSON array of subtasks:
+        [
+            {{
+                "title": "Subtask title",
+                "description": "Detailed description",
+                "required_capabilities": ["capability1", "capability2"],
+                "priority": 1-5,
+                "depends_on": []
+            }}
+        ]
+        
+        Title: {title}
+        Description: {description}
+        Required Capabilities: {required_capabilities}
+        """
+
+SYNTHESIS_PROMPT = """
+        Synthesize the results from multiple subtasks into a coherent final result.
+        
+        Provide a comprehensive synthesis that:
+        1. Combines all relevant information
+        2. Resolves any conflicts or contradictions
+        3. Presents a unified, actionable result
+        
+        Original Task: {title}
+        Description: {description}
+        
+        Subtask Results:
+        {subtask_results}
+        """
+
+CONFLICT_RESOLUTION_PROMPT = """
+        Resolve conflicts between multiple agent results for the same task.
+        
+        Analyze the results and provide:
+        1. Identification of key conflicts
+        2. Assessment of result quality and reliability
+        3. A consensus resolution that combines the best elements
+        4. Confidence score for the final resolution
+        
+        Respond with JSON:
+        {{
+            "conflicts_identified": ["conflict1", "conflict2"],
+            "resolution": "final resolved result",
+            "confidence_score": 0.0-1.0,
+            "reasoning": "explanation of resolution approach"
+        }}
+        
+        Task: {title}
+        Description: {description}
+        
+        Conflicting Results:
+        {conflicting_results}
+        """
+
+# Tasks that are still moving through the system and must stay resident in memory
+ACTIVE_TASK_STATUSES = (TaskStatus.PENDING, TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS)
+FINISHED_TASK_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+# Fetch only the columns mirrored in memory, and skip relationships
+TASK_LOAD_OPTIONS = (
+    load_only(
+        Task.id, Task.title, Task.description, Task.task_type,
+        Task.required_capabilities, Task.status, Task.priority,
+        Task.assigned_agent_id, Task.result, Task.created_at, Task.parent_task_id
+    ),
+    noload("*")
+)
+
+def _task_from_row(db_task: Task) -> TaskRecord:
+    """Build the in-memory task record from a database row"""
+    return TaskRecord(
+        id=db_task.id,
+        title=db_task.title,
+        description=db_task.description,
+        task_type=db_task.task_type,
+        required_capabilities=orjson.loads(db_task.required_capabilities) if db_task.required_capabilities else [],
+        status=db_task.status,
+        priority=db_task.priority,
+        assigned_agent_id=db_task.assigned_agent_id,
+        result=orjson.loads(db_task.result) if db_task.result else None,
+        created_at=db_task.created_at,
+        parent_task_id=db_task.parent_task_id
+    )
+
+@functools.lru_cache(maxsize=PLATFORM_CONFIG["archived_task_cache_size"])
+def _fetch_archived_task(task_id: str) -> Optional[TaskRecord]:
+    """Load a finished task that is no longer held in memory"""
+    db = SessionLocal()
+    try:
+        db_task = db.query(Task).options(*TASK_LOAD_OPTIONS).filter(Task.id == task_id).first()
+        return _task_from_row(db_task) if db_task else None
+    finally:
+        db.close()
+
 class OrchestrationEngine:
     """Main orchestration engine for coordinating multiple AI agents"""
     
     def __init__(self):
-        # Create database tables
+        # Create database tables, and add indexes that predate existing tables
         Base.metadata.create_all(bind=engine)
+        for table in (Task.__table__, Message.__table__):
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
         
         # In-memory caches for performance
         self.agents: Dict[str, BaseAgent] = {}
-        self.tasks: Dict[str, Dict[str, Any]] = {}
-        self.messages: List[Dict[str, Any]] = []
+        self.tasks: Dict[str, TaskRecord] = {}
+        self.messages: Deque[Dict[str, Any]] = deque(maxlen=PLATFORM_CONFIG["max_message_history"])
         self.agent_registry: Dict[str, List[str]] = defaultdict(list)  # capability -> agent_ids
-        self.task_queue: List[str] = []
+        self._cap_index: Dict[str, int] = {}  # capability -> bit position
+        self._agent_cap_masks: Dict[str, int] = {}  # agent_id -> capability bitset
+        # agent_id -> tasks assigned and not yet finished; reserved at assignment, before the
+        # agent itself adds them to current_tasks, so one scheduler pass cannot overfill an agent
+        self._agent_inflight: Dict[str, int] = {}
+        # Pending tasks ordered by (-priority, enqueue time); tasks no agent could take wait in _deferred
+        self._task_heap: List[Tuple[int, float, str]] = []
+        self._deferred: List[Tuple[int, float, str]] = []
+        self._sched_cv: Optional[asyncio.Condition] = None
+        self._scheduler: Optional[asyncio.Task] = None
+        
+        # Load-function scheduling state: alpha weights queue depth against oldest-task delay
+        # and is retuned from an exponential moving mean/variance of task wait times
+        self._load_alpha: float = 0.5
+        self._wait_mean: float = 0.0
+        self._wait_var: float = 0.0
+        self._assignments_since_tune: int = 0
         self.active_collaborations: Dict[str, Dict[str, Any]] = {}
         
+        # Futures handed out by completion_future, settled with the task's final status
+        self._completion_futures: Dict[str, asyncio.Future] = {}
+        
+        # Task indexes kept in step with self.tasks: status -> {task_id: task}, and newest tasks by creation
+        self.tasks_by_status: Dict[str, Dict[str, TaskRecord]] = defaultdict(dict)
+        self.recent_tasks: Deque[TaskRecord] = deque(maxlen=PLATFORM_CONFIG["recent_tasks_window"])
+        
+        # Running task counts per status, updated on every transition so status reads never scan tasks
+        self.status_counts: Dict[TaskStatus, int] = {status: 0 for status in TaskStatus}
+        
+        # Bumped on every task/agent/message mutation so observers can skip unchanged snapshots
+        self.state_version: int = 0
+        
+        # Task snapshots and messages waiting to be written by the background DB flusher
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._db_flusher: Optional[asyncio.Task] = None
+        self._db_conn: Optional[Connection] = None
+        
+        # Tasks changed since their last save, and the cached JSON columns of unfinished tasks:
+        # task_id -> (required_capabilities JSON, result object, result JSON)
+        self._dirty_task_ids: Set[str] = set()
+        self._task_json_cache: Dict[str, Tuple[str, Any, Optional[str]]] = {}
+        
+        # Last get_system_status snapshot, reused while state_version is unchanged and within the TTL
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_cache_version: int = -1
+        self._status_cache_ts: float = 0.0
+        
+        # Orchestrator LLM responses keyed by whitespace-normalized prompt hash: key -> (stored_at, content)
+        self._llm_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+        
         # Load existing data from database
         self._load_from_database()
         
         # Initialize system metrics
         self.system_metrics = {
-            "total_tasks": len(self.tasks),
-            "completed_tasks": len([t for t in self.tasks.values() if t["status"] == TaskStatus.COMPLETED]),
-            "failed_tasks": len([t for t in self.tasks.values() if t["status"] == TaskStatus.FAILED]),
+            "total_tasks": sum(self.status_counts.values()),
+            "completed_tasks": self.status_counts[TaskStatus.COMPLETED],
+            "failed_tasks": self.status_counts[TaskStatus.FAILED],
             "active_agents": 0,
             "average_response_time": 0.0,
             "system_load": 0.0
@@ -64,27 +279,37 @@ class OrchestrationEngine:
         try:
             db = SessionLocal()
             
-            # Load tasks
-            db_tasks = db.query(Task).all()
-            for db_task in db_tasks:
-                self.tasks[db_task.id] = {
-                    "id": db_task.id,
-                    "title": db_task.title,
-                    "description": db_task.description,
-                    "task_type": db_task.task_type,
-                    "required_capabilities": json.loads(db_task.required_capabilities) if db_task.required_capabilities else [],
-                    "status": db_task.status,
-                    "priority": db_task.priority,
-                    "assigned_agent_id": db_task.assigned_agent_id,
-                    "result": json.loads(db_task.result) if db_task.result else None,
-                    "created_at": db_task.created_at,
-                    "updated_at": db_task.updated_at,
-                    "completion_time": db_task.completion_time
-                }
+            # Keep every unfinished task in memory, plus the newest finished ones for the
+            # recent-task window; older finished tasks are fetched on demand by get_task
+            active_tasks = db.query(Task).options(*TASK_LOAD_OPTIONS).filter(
+                Task.status.in_(ACTIVE_TASK_STATUSES)
+            ).yield_per(500)
+            recent_finished = db.query(Task).options(*TASK_LOAD_OPTIONS).filter(
+                Task.status.notin_(ACTIVE_TASK_STATUSES)
+            ).order_by(Task.created_at.desc()).limit(self.recent_tasks.maxlen).all()
+            
+            loaded = [_task_from_row(db_task) for db_task in active_tasks]
+            loaded.extend(_task_from_row(db_task) for db_task in recent_finished)
+            loaded.sort(key=lambda t: t.created_at or datetime.min)
+            for task in loaded:
+                self.tasks[task.id] = task
+                self._index_task(task)
             
-            # Load messages
-            db_messages = db.query(Message).all()
-            for db_message in db_messages:
+            # Status totals come from the whole table, not just the rows kept in memory
+            for status, count in db.query(Task.status, func.count(Task.id)).group_by(Task.status):
+                if status in self.status_counts:
+                    self.status_counts[status] = count
+            
+            # Load only the newest messages that fit in the bounded history, oldest first
+            db_messages = db.query(Message).options(
+                load_only(
+                    Message.id, Message.sender_id, Message.receiver_id, Message.task_id,
+                    Message.message_type, Message.content, Message.message_metadata,
+                    Message.timestamp, Message.is_read
+                ),
+                noload("*")
+            ).order_by(Message.timestamp.desc()).limit(self.messages.maxlen).all()
+            for db_message in reversed(db_messages):
                 self.messages.append({
                     "id": db_message.id,
                     "sender_id": db_message.sender_id,
@@ -92,7 +317,7 @@ class OrchestrationEngine:
                     "task_id": db_message.task_id,
                     "message_type": db_message.message_type,
                     "content": db_message.content,
-                    "message_metadata": json.loads(db_message.message_metadata) if db_message.message_metadata else {},
+                    "message_metadata": orjson.loads(db_message.message_metadata) if db_message.message_metadata else {},
                     "timestamp": db_message.timestamp,
                     "is_read": db_message.is_read
                 })
@@ -103,52 +328,186 @@ class OrchestrationEngine:
         except Exception as e:
             logger.error(f"Error loading from database: {e}")
     
-    def _save_task_to_database(self, task: Dict[str, Any]):
-        """Save or update a task in the database"""
-        try:
-            db = SessionLocal()
+    def _save_task_to_database(self, task: TaskRecord):
+        """Queue the task's persisted columns to be saved or updated in the database"""
+        task_id = task.id
+        if task_id not in self._dirty_task_ids:
+            return
+        self._dirty_task_ids.discard(task_id)
+        
+        # required_capabilities never changes and result only when replaced, so reuse their JSON
+        cached = self._task_json_cache.get(task_id)
+        result = task.result
+        if cached is None:
+            caps_json = orjson.dumps(task.required_capabilities, default=str).decode()
+        else:
+            caps_json = cached[0]
+        if cached is not None and cached[1] is result:
+            result_json = cached[2]
+        else:
+            result_json = orjson.dumps(result, default=str).decode() if result else None
+        # Finished tasks are rarely saved again, so drop their entry once the final row is queued
+        if task.status in FINISHED_TASK_STATUSES:
+            self._task_json_cache.pop(task_id, None)
+        else:
+            self._task_json_cache[task_id] = (caps_json, result, result_json)
+        
+        self._queue_db_write("task", {
+            "id": task_id,
+            "title": task.title,
+            "description": task.description,
+            "task_type": task.task_type,
+            "required_capabilities": caps_json,
+            "status": task.status,
+            "priority": task.priority,
+            "assigned_agent_id": task.assigned_agent_id,
+            "result": result_json,
+            "created_at": task.created_at or datetime.utcnow()
+        })
+    
+    def _queue_db_write(self, kind: str, record: Dict[str, Any]):
+        """Hand a record to the background flusher, starting it on first use"""
+        if self._write_queue is None:
+            self._write_queue = asyncio.Queue()
+        if self._db_flusher is None or self._db_flusher.done():
+            self._db_flusher = asyncio.create_task(self._run_db_flusher())
+        self._write_queue.put_nowait((kind, record))
+    
+    async def _run_db_flusher(self):
+        """Background loop that coalesces queued writes into one transaction per batch"""
+        queue = self._write_queue
+        max_batch = PLATFORM_CONFIG["db_flush_max_batch"]
+        while True:
+            items = [await queue.get()]
             
-            # Check if task exists
-            db_task = db.query(Task).filter(Task.id == task["id"]).first()
+            try:
+                # Give further writes a short window to join this transaction. A plain sleep
+                # rather than wait_for(get()), which can swallow a cancel that races the get
+                if queue.qsize() < max_batch - 1:
+                    await asyncio.sleep(PLATFORM_CONFIG["db_flush_interval_ms"] / 1000)
+                while len(items) < max_batch and not queue.empty():
+                    items.append(queue.get_nowait())
+            except asyncio.CancelledError:
+                # Still commit what was taken or is waiting on the queue, so join() cannot hang on it
+                while not queue.empty():
+                    items.append(queue.get_nowait())
+                await self._write_items(items)
+                raise
             
-            if db_task:
-                # Update existing task
-                db_task.title = task["title"]
-                db_task.description = task["description"]
-                db_task.task_type = task["task_type"]
-                db_task.required_capabilities = json.dumps(task["required_capabilities"])
-                db_task.status = task["status"]
-                db_task.priority = task["priority"]
-                db_task.assigned_agent_id = task.get("assigned_agent_id")
-                db_task.result = json.dumps(task.get("result")) if task.get("result") else None
-                db_task.updated_at = datetime.utcnow()
-                db_task.completion_time = task.get("completion_time")
+            await self._write_items(items)
+    
+    async def _write_items(self, items: List[Tuple[str, Dict[str, Any]]]):
+        """Write one batch of queued records and mark them done on the queue"""
+        # Repeated updates to the same task collapse to its latest row
+        tasks: Dict[str, Dict[str, Any]] = {}
+        messages: List[Dict[str, Any]] = []
+        for kind, record in items:
+            if kind == "task":
+                tasks[record["id"]] = record
             else:
-                # Create new task
-                db_task = Task(
-                    id=task["id"],
-                    title=task["title"],
-                    description=task["description"],
-                    task_type=task["task_type"],
-                    required_capabilities=json.dumps(task["required_capabilities"]),
-                    status=task["status"],
-                    priority=task["priority"],
-                    assigned_agent_id=task.get("assigned_agent_id"),
-                    result=json.dumps(task.get("result")) if task.get("result") else None,
-                    created_at=task.get("created_at", datetime.utcnow()),
-                    updated_at=datetime.utcnow(),
-                    completion_time=task.get("completion_time")
-                )
-                db.add(db_task)
-            
-            db.commit()
-            db.close()
+                messages.append(record)
+        
+        try:
+            await asyncio.to_thread(self._write_batch, list(tasks.values()), messages)
+        finally:
+            for _ in items:
+                self._write_queue.task_done()
+    
+    async def flush_pending_writes(self):
+        """Wait until every queued task and message write has been committed"""
+        if self._write_queue is not None:
+            await self._write_queue.join()
+    
+    async def close(self):
+        """Commit all queued writes, stop the background flusher and release its DB connection"""
+        await self.flush_pending_writes()
+        
+        flusher, self._db_flusher = self._db_flusher, None
+        if flusher is not None and not flusher.done():
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        
+        if self._db_conn is not None:
+            conn, self._db_conn = self._db_conn, None
+            await asyncio.to_thread(conn.close)
+    
+    def _write_batch(self, tasks: List[Dict[str, Any]], messages: List[Dict[str, Any]]):
+        """Save a batch of task rows and new messages in a single transaction"""
+        if self._db_conn is None:
+            self._db_conn = engine.connect()
+        conn = self._db_conn
+        try:
+            if tasks:
+                conn.execute(TASK_UPSERT, tasks)
+            if messages:
+                conn.execute(MESSAGE_INSERT, [
+                    {
+                        "id": message["id"],
+                        "sender_id": message["sender_id"],
+                        "receiver_id": message["receiver_id"],
+                        "task_id": message["task_id"],
+                        "message_type": message["message_type"],
+                        "content": message["content"],
+                        "message_metadata": orjson.dumps(message["message_metadata"], default=str).decode(),
+                        "timestamp": message["timestamp"],
+                        "is_read": message["is_read"]
+                    }
+                    for message in messages
+                ])
+            conn.commit()
             
         except Exception as e:
-            logger.error(f"Error saving task to database: {e}")
-            db.rollback()
-            db.close()
+            logger.error(f"Error saving {len(tasks)} tasks and {len(messages)} messages to database: {e}")
+            conn.rollback()
+            if conn.invalidated:
+                conn.close()
+                self._db_conn = None
 
+    def _index_task(self, task: TaskRecord):
+        """Add a newly created or loaded task to the status and recency indexes"""
+        self.tasks_by_status[task.status][task.id] = task
+        self.status_counts[task.status] += 1
+        self.recent_tasks.append(task)
+        self._dirty_task_ids.add(task.id)
+    
+    def _set_task_status(self, task: TaskRecord, new_status: TaskStatus):
+        """Update a task's status, keeping the status index in sync, and mark system state as changed"""
+        self.tasks_by_status[task.status].pop(task.id, None)
+        self.status_counts[task.status] -= 1
+        task.status = new_status
+        self.tasks_by_status[new_status][task.id] = task
+        self.status_counts[new_status] += 1
+        self._dirty_task_ids.add(task.id)
+        self.state_version += 1
+        # Failures may still be retried, so only the failure handlers settle those
+        if new_status in (TaskStatus.COMPLETED, TaskStatus.CANCELLED):
+            self._settle_completion(task)
+    
+    def _settle_completion(self, task: TaskRecord):
+        """Resolve anyone awaiting this task's completion with its final status"""
+        future = self._completion_futures.pop(task.id, None)
+        if future is not None and not future.done():
+            future.set_result(task.status)
+    
+    def completion_future(self, task_id: str) -> asyncio.Future:
+        """Future that resolves with the task's status once it completes, fails for good or is cancelled"""
+        task = self.get_task(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        
+        future = self._completion_futures.get(task_id)
+        if future is None or future.cancelled():
+            future = asyncio.get_running_loop().create_future()
+            # A failed task is always past its retries by the time anyone else can observe it
+            if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
+                future.set_result(task.status)
+            else:
+                self._completion_futures[task_id] = future
+        return future
+    
     def _initialize_agents(self):
         """Initialize default agents for each type"""
         for agent_type, config in AGENT_TYPES.items():
@@ -160,135 +519,216 @@ class OrchestrationEngine:
                 self.agents[agent_id] = agent
                 
                 # Register agent capabilities
+                mask = 0
                 for capability in agent.capabilities:
                     self.agent_registry[capability].append(agent_id)
+                    mask |= 1 << self._cap_index.setdefault(capability, len(self._cap_index))
+                self._agent_cap_masks[agent_id] = mask
+                self._agent_inflight[agent_id] = 0
         
         self.system_metrics["active_agents"] = len(self.agents)
         logger.info(f"Initialized {len(self.agents)} agents across {len(AGENT_TYPES)} types")
     
-    async def submit_task(self, task_data: Dict[str, Any]) -> str:
-        """Submit a new task to the orchestration system"""
+    def _register_task(self, task_data: Union[Dict[str, Any], TaskCreate]) -> TaskRecord:
+        """Create, index and queue the database write for a new task"""
         task_id = str(uuid.uuid4())
         
-        task = {
-            "id": task_id,
-            "title": task_data["title"],
-            "description": task_data["description"],
-            "task_type": task_data.get("task_type", "general"),
-            "required_capabilities": task_data["required_capabilities"],
-            "priority": task_data.get("priority", 1),
-            "status": TaskStatus.PENDING,
-            "created_at": datetime.utcnow(),
-            "deadline": task_data.get("deadline"),
-            "parent_task_id": task_data.get("parent_task_id"),
-            "subtasks": [],
-            "assigned_agent_id": None,
-            "result": None,
-            "error_message": None,
-            "progress_percentage": 0.0
-        }
+        if isinstance(task_data, TaskCreate):
+            # Submission structs carry exactly the top-level task fields, read as attributes
+            task = TaskRecord(
+                id=task_id,
+                title=task_data.title,
+                description=task_data.description,
+                task_type=task_data.task_type,
+                required_capabilities=task_data.required_capabilities,
+                priority=task_data.priority,
+                status=TaskStatus.PENDING,
+                created_at=datetime.utcnow(),
+                deadline=task_data.deadline
+            )
+        else:
+            task = TaskRecord(
+                id=task_id,
+                title=task_data["title"],
+                description=task_data["description"],
+                task_type=task_data.get("task_type", "general"),
+                required_capabilities=task_data["required_capabilities"],
+                priority=task_data.get("priority", 1),
+                status=TaskStatus.PENDING,
+                created_at=datetime.utcnow(),
+                deadline=task_data.get("deadline"),
+                parent_task_id=task_data.get("parent_task_id"),
+                subtask_index=task_data.get("subtask_index")
+            )
         
         self.tasks[task_id] = task
+        self._index_task(task)
         self.system_metrics["total_tasks"] += 1
+        self.state_version += 1
         
         # Save task to database
         self._save_task_to_database(task)
+        return task
+    
+    async def _route_new_task(self, task: TaskRecord) -> bool:
+        """Decompose a new task or queue it for assignment; returns whether it was queued"""
+        if await self._needs_decomposition(task):
+            await self._decompose_task(task.id)
+            return False
+        self._enqueue_task(task)
+        return True
+    
+    async def submit_task(self, task_data: Union[Dict[str, Any], TaskCreate]) -> str:
+        """Submit a new task to the orchestration system"""
+        task = self._register_task(task_data)
         
         # Check if task needs decomposition
-        if await self._needs_decomposition(task):
-            await self._decompose_task(task_id)
-        else:
-            self.task_queue.append(task_id)
-            await self._process_task_queue()
+        if await self._route_new_task(task):
+            await self._wake_scheduler()
         
-        logger.info(f"Task submitted: {task_id} - {task['title']}")
-        return task_id
+        logger.info(f"Task submitted: {task.id} - {task.title}")
+        return task.id
     
-    async def _needs_decomposition(self, task: Dict[str, Any]) -> bool:
-        """Determine if a task needs to be decomposed into subtasks"""
-        # Use LLM to analyze task complexity
-        analysis_prompt = f"""
-        Analyze this task and determine if it needs to be broken down into subtasks:
+    async def submit_tasks(self, tasks_data: List[Union[Dict[str, Any], TaskCreate]]) -> List[str]:
+        """Submit several tasks at once, returning their IDs in input order"""
+        # Register everything first so the rows reach the flusher together and share one transaction
+        tasks = [self._register_task(task_data) for task_data in tasks_data]
         
-        Title: {task['title']}
-        Description: {task['description']}
-        Required Capabilities: {task['required_capabilities']}
+        # Decomposition checks overlap, and the scheduler is woken once for the whole batch
+        queued = await asyncio.gather(*(self._route_new_task(task) for task in tasks))
+        if any(queued):
+            await self._wake_scheduler()
         
-        Consider:
-        1. Task complexity and scope
-        2. Multiple capability requirements
-        3. Potential for parallel execution
+        logger.info(f"Submitted {len(tasks)} tasks")
+        return [task.id for task in tasks]
+    
+    async def _invoke_llm(self, prompt: str) -> str:
+        """Run an orchestrator prompt through the LLM, reusing recent responses to equivalent prompts"""
+        key = hashlib.sha256(" ".join(prompt.split()).encode()).digest()
+        entry = self._llm_cache.get(key)
+        if entry is not None:
+            stored_at, content = entry
+            if time.monotonic() - stored_at <= PLATFORM_CONFIG["response_cache_ttl_seconds"]:
+                self._llm_cache.move_to_end(key)
+                return content
+            del self._llm_cache[key]
         
-        Respond with JSON: {{"needs_decomposition": true/false, "reasoning": "explanation"}}
-        """
+        # Async call through the shared batcher, so concurrent prompts share one abatch request
+        from langchain_core.messages import HumanMessage
+        
+        response = await LLM_BATCHER.submit([HumanMessage(content=prompt)])
+        content = response.content
+        
+        self._llm_cache[key] = (time.monotonic(), content)
+        while len(self._llm_cache) > PLATFORM_CONFIG["response_cache_size"]:
+            self._llm_cache.popitem(last=False)
+        return content
+    
+    async def _needs_decomposition(self, task: TaskRecord) -> bool:
+        """Determine if a task needs to be decomposed into subtasks"""
+        # Use LLM to analyze task complexity
+        analysis_prompt = NEEDS_DECOMPOSITION_PROMPT.format(
+            title=task.title,
+            description=task.description,
+            required_capabilities=task.required_capabilities
+        )
         
         try:
-            response = await asyncio.to_thread(self.llm.invoke, analysis_prompt)
-            analysis = json.loads(response.content)
+            analysis = orjson.loads(await self._invoke_llm(analysis_prompt))
             return analysis.get("needs_decomposition", False)
         except:
             # Default to no decomposition if analysis fails
-            return len(task["required_capabilities"]) > 2
+            return len(task.required_capabilities) > 2
     
     async def _decompose_task(self, task_id: str):
         """Decompose a complex task into smaller subtasks"""
         task = self.tasks[task_id]
         
-        decomposition_prompt = f"""
-        Decompose this complex task into smaller, manageable subtasks:
-        
-        Title: {task['title']}
-        Description: {task['description']}
-        Required Capabilities: {task['required_capabilities']}
-        
-        Create subtasks that:
-        1. Can be executed independently or with minimal dependencies
-        2. Each require specific capabilities
-        3. Together accomplish the main task
-        
-        Respond with JSON array of subtasks:
-        [
-            {{
-                "title": "Subtask title",
-                "description": "Detailed description",
-                "required_capabilities": ["capability1", "capability2"],
-                "priority": 1-5,
-                "depends_on": []
-            }}
-        ]
-        """
+        decomposition_prompt = DECOMPOSITION_PROMPT.format(
+            title=task.title,
+            description=task.description,
+            required_capabilities=task.required_capabilities
+        )
         
         try:
-            response = await asyncio.to_thread(self.llm.invoke, decomposition_prompt)
-            subtasks_data = json.loads(response.content)
+            subtasks_data = orjson.loads(await self._invoke_llm(decomposition_prompt))
             
-            for subtask_data in subtasks_data:
-                subtask_id = await self.submit_task({
+            # Children report completion by index, so the parent never rescans its siblings
+            task.pending_children = len(subtasks_data)
+            task.child_results = [None] * len(subtasks_data)
+            
+            # Submit subtasks as one batch so their own LLM analyses overlap
+            subtask_ids = await self.submit_tasks([
+                {
                     **subtask_data,
                     "parent_task_id": task_id,
-                    "task_type": task["task_type"]
-                })
-                task["subtasks"].append(subtask_id)
+                    "subtask_index": index,
+                    "task_type": task.task_type
+                }
+                for index, subtask_data in enumerate(subtasks_data)
+            ])
+            task.subtasks.extend(subtask_ids)
             
-            task["status"] = TaskStatus.IN_PROGRESS
+            self._set_task_status(task, TaskStatus.IN_PROGRESS)
             logger.info(f"Task {task_id} decomposed into {len(subtasks_data)} subtasks")
             
             # Save updated task to database
             self._save_task_to_database(task)
             
+            # Subtasks may have finished while their siblings were still being submitted
+            await self._check_parent_task_completion(task_id)
+            
         except Exception as e:
             logger.error(f"Failed to decompose task {task_id}: {e}")
             # Fall back to treating as single task
-            self.task_queue.append(task_id)
-            await self._process_task_queue()
+            self._enqueue_task(task)
+            await self._wake_scheduler()
+    
+    def _enqueue_task(self, task: TaskRecord):
+        """Push a pending task onto the priority queue"""
+        heapq.heappush(self._task_heap, (-task.priority, time.monotonic(), task.id))
+    
+    def _release_deferred_tasks(self):
+        """Merge tasks that found no agent back into the queue once capacity frees up"""
+        if self._deferred:
+            self._task_heap.extend(self._deferred)
+            self._deferred.clear()
+            heapq.heapify(self._task_heap)
+    
+    def _any_agent_free(self) -> bool:
+        """Whether any agent has spare capacity for another task"""
+        return any(
+            self._agent_inflight[agent_id] < agent.max_concurrent_tasks
+            for agent_id, agent in self.agents.items()
+        )
+    
+    async def _wake_scheduler(self):
+        """Tell the scheduler that tasks were queued or agent capacity changed, starting it on first use"""
+        if self._sched_cv is None:
+            self._sched_cv = asyncio.Condition()
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.create_task(self._run_scheduler())
+        async with self._sched_cv:
+            self._sched_cv.notify_all()
+    
+    async def _run_scheduler(self):
+        """Background loop that assigns queued tasks whenever there is work and a free agent"""
+        while True:
+            async with self._sched_cv:
+                await self._sched_cv.wait_for(lambda: self._task_heap and self._any_agent_free())
+            try:
+                await self._process_task_queue()
+            except Exception as e:
+                logger.error(f"Error processing task queue: {e}")
     
     async def _process_task_queue(self):
-        """Process pending tasks in the queue"""
-        while self.task_queue:
-            task_id = self.task_queue.pop(0)
+        """Process pending tasks in the queue, highest priority first"""
+        while self._task_heap:
+            entry = heapq.heappop(self._task_heap)
+            task_id = entry[2]
             task = self.tasks[task_id]
             
-            if task["status"] != TaskStatus.PENDING:
+            if task.status != TaskStatus.PENDING:
                 continue
             
             # Find best agent for the task
@@ -297,51 +737,99 @@ class OrchestrationEngine:
             if best_agent_id:
                 await self._assign_task(task_id, best_agent_id)
             else:
-                # No suitable agent available, put back in queue
-                self.task_queue.append(task_id)
-                break
+                # No suitable agent available; park it until an agent frees up
+                self._deferred.append(entry)
     
-    async def _find_best_agent(self, task: Dict[str, Any]) -> Optional[str]:
+    async def _find_best_agent(self, task: TaskRecord) -> Optional[str]:
         """Find the best available agent for a task using capability matching and load balancing"""
-        required_caps = task["required_capabilities"]
+        required_caps = task.required_capabilities
         candidate_agents = []
+        now = datetime.utcnow()
+        
+        # Build the task's capability bitset; a capability no agent has means no match
+        task_mask = 0
+        for capability in required_caps:
+            bit = self._cap_index.get(capability)
+            if bit is None:
+                return None
+            task_mask |= 1 << bit
+        
+        # Only agents registered for the rarest required capability can qualify
+        if required_caps:
+            candidate_ids = min((self.agent_registry[c] for c in required_caps), key=len)
+        else:
+            candidate_ids = self.agents.keys()
         
         # Find agents with required capabilities
-        for agent_id, agent in self.agents.items():
-            if (agent.can_handle_task(required_caps) and 
+        for agent_id in candidate_ids:
+            agent = self.agents[agent_id]
+            agent_mask = self._agent_cap_masks[agent_id]
+            queue_depth = self._agent_inflight[agent_id]
+            if (agent_mask & task_mask == task_mask and 
                 agent.status in [AgentStatus.IDLE, AgentStatus.BUSY] and
-                len(agent.current_tasks) < agent.max_concurrent_tasks):
+                queue_depth < agent.max_concurrent_tasks):
                 
-                # Calculate agent score based on load, performance, and capability match
-                load_score = agent.get_load_score()
-                performance_score = agent.performance_metrics["success_rate"]
-                capability_score = len(set(required_caps) & set(agent.capabilities)) / len(required_caps)
+                capability_score = (agent_mask & task_mask).bit_count() / len(required_caps) if required_caps else 1.0
                 
-                total_score = (capability_score * 0.4 + 
-                             performance_score * 0.4 + 
-                             (1 - load_score) * 0.2)
+                # Queue depth (including assignments not yet started) and age of the oldest
+                # task the agent is still working on
+                started = (self.tasks[tid].started_at for tid in agent.current_tasks if tid in self.tasks)
+                max_delay = max(
+                    ((now - started_at).total_seconds() for started_at in started if started_at),
+                    default=0.0
+                )
                 
-                candidate_agents.append((agent_id, total_score))
+                candidate_agents.append((agent_id, capability_score, queue_depth, max_delay,
+                                         agent.get_load_score(), agent.tasks_completed))
         
         if not candidate_agents:
             return None
         
-        # Sort by score and return best agent
-        candidate_agents.sort(key=lambda x: x[1], reverse=True)
-        return candidate_agents[0][0]
+        # Load function L = a*Q/maxQ + (1-a)*D/maxD, normalized across the candidates
+        max_queue = max(c[2] for c in candidate_agents) or 1
+        max_delay = max(c[3] for c in candidate_agents) or 1.0
+        alpha = self._load_alpha
+        
+        def score(candidate):
+            load = alpha * candidate[2] / max_queue + (1 - alpha) * candidate[3] / max_delay
+            return candidate[1] * (1 - load)
+        
+        # Highest score wins; ties go to the less (priority-weighted) loaded, then less used agent
+        best = min(candidate_agents, key=lambda c: (-score(c), c[4], c[5]))
+        return best[0]
+    
+    def _record_wait_time(self, task: TaskRecord):
+        """Track how long tasks wait for an agent and retune the load function's alpha"""
+        wait = (task.assigned_at - task.created_at).total_seconds()
+        ema = PLATFORM_CONFIG["wait_time_ema_alpha"]
+        delta = wait - self._wait_mean
+        self._wait_mean += ema * delta
+        self._wait_var = (1 - ema) * (self._wait_var + ema * delta * delta)
+        
+        self._assignments_since_tune += 1
+        if self._assignments_since_tune >= PLATFORM_CONFIG["load_alpha_tune_interval"]:
+            self._assignments_since_tune = 0
+            # Widely spread wait times mean some tasks are starving behind long-running
+            # ones, so shift weight from queue depth toward the oldest outstanding task
+            spread = self._wait_var ** 0.5 / self._wait_mean if self._wait_mean > 0 else 0.0
+            self._load_alpha = min(0.9, max(0.1, 1 / (1 + spread)))
     
     async def _assign_task(self, task_id: str, agent_id: str):
         """Assign a task to a specific agent"""
         task = self.tasks[task_id]
         agent = self.agents[agent_id]
         
-        task["assigned_agent_id"] = agent_id
-        task["assigned_at"] = datetime.utcnow()
-        task["status"] = TaskStatus.ASSIGNED
+        task.assigned_agent_id = agent_id
+        task.assigned_at = datetime.utcnow()
+        self._set_task_status(task, TaskStatus.ASSIGNED)
+        self._record_wait_time(task)
         
         # Save updated task to database
         self._save_task_to_database(task)
         
+        # Reserve the agent's slot now; _execute_task releases it when the task finishes
+        self._agent_inflight[agent_id] += 1
+        
         # Send task to agent for execution
         asyncio.create_task(self._execute_task(task_id, agent_id))
         
@@ -352,19 +840,19 @@ class OrchestrationEngine:
         task = self.tasks[task_id]
         agent = self.agents[agent_id]
         
-        task["status"] = TaskStatus.IN_PROGRESS
-        task["started_at"] = datetime.utcnow()
+        self._set_task_status(task, TaskStatus.IN_PROGRESS)
+        task.started_at = datetime.utcnow()
         
         try:
             # Execute task
             result = await agent.execute_task(task)
             
-            if result["status"] == "success":
-                task["status"] = TaskStatus.COMPLETED
-                task["result"] = json.dumps(result["result"])
-                task["completed_at"] = datetime.utcnow()
-                task["actual_duration"] = result["completion_time"]
-                task["progress_percentage"] = 100.0
+            if result.status == "success":
+                self._set_task_status(task, TaskStatus.COMPLETED)
+                task.result = msgspec.json.encode(result.result).decode()
+                task.completed_at = datetime.utcnow()
+                task.actual_duration = result.completion_time
+                task.progress_percentage = 100.0
                 
                 self.system_metrics["completed_tasks"] += 1
                 
@@ -372,13 +860,13 @@ class OrchestrationEngine:
                 self._save_task_to_database(task)
                 
                 # Check if parent task is complete
-                if task["parent_task_id"]:
-                    await self._check_parent_task_completion(task["parent_task_id"])
+                if task.parent_task_id:
+                    await self._record_subtask_completion(task)
                 
             else:
-                task["status"] = TaskStatus.FAILED
-                task["error_message"] = result["error"]
-                task["completed_at"] = datetime.utcnow()
+                self._set_task_status(task, TaskStatus.FAILED)
+                task.error_message = result.error
+                task.completed_at = datetime.utcnow()
                 
                 self.system_metrics["failed_tasks"] += 1
                 
@@ -389,90 +877,94 @@ class OrchestrationEngine:
                 await self._handle_task_failure(task_id)
             
         except Exception as e:
-            task["status"] = TaskStatus.FAILED
-            task["error_message"] = str(e)
-            task["completed_at"] = datetime.utcnow()
+            self._set_task_status(task, TaskStatus.FAILED)
+            task.error_message = str(e)
+            task.completed_at = datetime.utcnow()
             
             self.system_metrics["failed_tasks"] += 1
             logger.error(f"Task execution failed: {task_id} - {e}")
+            self._settle_completion(task)
             
             # Save updated task to database
             self._save_task_to_database(task)
+        
+        finally:
+            # The agent has capacity again, so give deferred tasks another chance
+            self._agent_inflight[agent_id] -= 1
+            self._release_deferred_tasks()
+            await self._wake_scheduler()
+    
+    async def _record_subtask_completion(self, subtask: TaskRecord):
+        """Store a completed subtask's result on its parent and count it off"""
+        parent_task = self.tasks.get(subtask.parent_task_id)
+        if parent_task is None or parent_task.pending_children is None:
+            return
+        
+        parent_task.child_results[subtask.subtask_index] = subtask.result
+        parent_task.pending_children -= 1
+        await self._check_parent_task_completion(parent_task.id)
     
     async def _check_parent_task_completion(self, parent_task_id: str):
-        """Check if all subtasks of a parent task are complete"""
+        """Complete a parent task once all of its subtasks are complete"""
         parent_task = self.tasks[parent_task_id]
         
-        all_complete = True
-        results = []
+        # Wait until decomposition has registered every subtask and all of them have completed
+        if parent_task.status != TaskStatus.IN_PROGRESS or parent_task.pending_children:
+            return
         
-        for subtask_id in parent_task["subtasks"]:
-            subtask = self.tasks[subtask_id]
-            if subtask["status"] != TaskStatus.COMPLETED:
-                all_complete = False
-                break
-            else:
-                results.append(subtask["result"])
+        # Synthesize results from subtasks, in subtask order
+        synthesis_result = await self._synthesize_results(parent_task_id, parent_task.child_results)
         
-        if all_complete:
-            # Synthesize results from subtasks
-            synthesis_result = await self._synthesize_results(parent_task_id, results)
-            
-            parent_task["status"] = TaskStatus.COMPLETED
-            parent_task["result"] = synthesis_result
-            parent_task["completed_at"] = datetime.utcnow()
-            parent_task["progress_percentage"] = 100.0
-            
-            logger.info(f"Parent task {parent_task_id} completed with synthesized results")
-            
-            # Save updated parent task to database
-            self._save_task_to_database(parent_task)
+        self._set_task_status(parent_task, TaskStatus.COMPLETED)
+        parent_task.result = synthesis_result
+        parent_task.completed_at = datetime.utcnow()
+        parent_task.progress_percentage = 100.0
+        
+        logger.info(f"Parent task {parent_task_id} completed with synthesized results")
+        
+        # Save updated parent task to database
+        self._save_task_to_database(parent_task)
+        
+        # A decomposed subtask completing counts toward its own parent
+        if parent_task.parent_task_id:
+            await self._record_subtask_completion(parent_task)
     
     async def _synthesize_results(self, parent_task_id: str, subtask_results: List[str]) -> str:
         """Synthesize results from multiple subtasks"""
         parent_task = self.tasks[parent_task_id]
         
-        synthesis_prompt = f"""
-        Synthesize the results from multiple subtasks into a coherent final result:
-        
-        Original Task: {parent_task['title']}
-        Description: {parent_task['description']}
-        
-        Subtask Results:
-        {chr(10).join([f"- {result}" for result in subtask_results])}
-        
-        Provide a comprehensive synthesis that:
-        1. Combines all relevant information
-        2. Resolves any conflicts or contradictions
-        3. Presents a unified, actionable result
-        """
+        synthesis_prompt = SYNTHESIS_PROMPT.format(
+            title=parent_task.title,
+            description=parent_task.description,
+            subtask_results="\n".join(f"- {result}" for result in subtask_results)
+        )
         
         try:
-            response = await asyncio.to_thread(self.llm.invoke, synthesis_prompt)
-            return response.content
+            return await self._invoke_llm(synthesis_prompt)
         except Exception as e:
             logger.error(f"Failed to synthesize results for task {parent_task_id}: {e}")
-            return json.dumps({"synthesized_results": subtask_results, "error": str(e)})
+            return orjson.dumps({"synthesized_results": subtask_results, "error": str(e)}, default=str).decode()
     
     async def _handle_task_failure(self, task_id: str):
         """Handle task failure with retry logic"""
         task = self.tasks[task_id]
         
         # Simple retry logic - could be enhanced
-        retry_count = task.get("retry_count", 0)
+        retry_count = task.retry_count
         
         if retry_count < PLATFORM_CONFIG["max_retries"]:
-            task["retry_count"] = retry_count + 1
-            task["status"] = TaskStatus.PENDING
-            task["assigned_agent_id"] = None
+            task.retry_count = retry_count + 1
+            self._set_task_status(task, TaskStatus.PENDING)
+            task.assigned_agent_id = None
             
             # Add back to queue for reassignment
-            self.task_queue.append(task_id)
-            await self._process_task_queue()
+            self._enqueue_task(task)
+            await self._wake_scheduler()
             
             logger.info(f"Retrying task {task_id} (attempt {retry_count + 1})")
         else:
             logger.error(f"Task {task_id} failed after {retry_count} retries")
+            self._settle_completion(task)
     
     async def request_collaboration(self, requesting_agent_id: str, task_id: str, 
                                   required_capabilities: List[str], 
@@ -482,11 +974,13 @@ class OrchestrationEngine:
         
         # Find suitable collaborating agents
         collaborating_agents = []
+        seen = {requesting_agent_id}
         for cap in required_capabilities:
-            for agent_id in self.agent_registry[cap]:
-                if (agent_id != requesting_agent_id and 
-                    agent_id not in collaborating_agents and
-                    self.agents[agent_id].status != AgentStatus.OFFLINE):
+            for agent_id in self.agent_registry.get(cap, ()):
+                if agent_id in seen:
+                    continue
+                seen.add(agent_id)
+                if self.agents[agent_id].status != AgentStatus.OFFLINE:
                     collaborating_agents.append(agent_id)
         
         if not collaborating_agents:
@@ -505,6 +999,7 @@ class OrchestrationEngine:
         }
         
         self.active_collaborations[collaboration_id] = collaboration
+        self.state_version += 1
         
         # Send collaboration request to agents
         for agent_id in collaborating_agents:
@@ -535,61 +1030,24 @@ class OrchestrationEngine:
         }
         
         self.messages.append(message)
+        self.state_version += 1
         logger.debug(f"Message sent from {sender_id} to {receiver_id}: {message_type}")
         
         # Save message to database
-        try:
-            db = SessionLocal()
-            db_message = Message(
-                id=message["id"],
-                sender_id=message["sender_id"],
-                receiver_id=message["receiver_id"],
-                task_id=message["task_id"],
-                message_type=message["message_type"],
-                content=message["content"],
-                message_metadata=json.dumps(message["message_metadata"]),
-                timestamp=message["timestamp"],
-                is_read=message["is_read"]
-            )
-            db.add(db_message)
-            db.commit()
-            db.close()
-        except Exception as e:
-            logger.error(f"Error saving message to database: {e}")
-            db.rollback()
-            db.close()
+        self._queue_db_write("message", message)
     
     async def resolve_conflict(self, task_id: str, conflicting_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Resolve conflicts between agent results using consensus building"""
         task = self.tasks[task_id]
         
-        conflict_resolution_prompt = f"""
-        Resolve conflicts between multiple agent results for the same task:
-        
-        Task: {task['title']}
-        Description: {task['description']}
-        
-        Conflicting Results:
-        {json.dumps(conflicting_results, indent=2)}
-        
-        Analyze the results and provide:
-        1. Identification of key conflicts
-        2. Assessment of result quality and reliability
-        3. A consensus resolution that combines the best elements
-        4. Confidence score for the final resolution
-        
-        Respond with JSON:
-        {{
-            "conflicts_identified": ["conflict1", "conflict2"],
-            "resolution": "final resolved result",
-            "confidence_score": 0.0-1.0,
-            "reasoning": "explanation of resolution approach"
-        }}
-        """
+        conflict_resolution_prompt = CONFLICT_RESOLUTION_PROMPT.format(
+            title=task.title,
+            description=task.description,
+            conflicting_results=json.dumps(conflicting_results, indent=2)
+        )
         
         try:
-            response = await asyncio.to_thread(self.llm.invoke, conflict_resolution_prompt)
-            resolution = json.loads(response.content)
+            resolution = orjson.loads(await self._invoke_llm(conflict_resolution_prompt))
             
             logger.info(f"Conflict resolved for task {task_id} with confidence {resolution['confidence_score']}")
             return resolution
@@ -604,10 +1062,61 @@ class OrchestrationEngine:
                 "reasoning": f"Automatic fallback due to resolution error: {e}"
             }
     
+    def get_task(self, task_id: str) -> Optional[TaskRecord]:
+        """Get a task by ID, falling back to the database for finished tasks not kept in memory"""
+        task = self.tasks.get(task_id)
+        if task is None:
+            task = _fetch_archived_task(task_id)
+        return task
+    
+    def get_status_bulk(self, task_ids: List[str]) -> Dict[str, str]:
+        """Current status for each known task ID, with one database query for tasks not in memory"""
+        statuses: Dict[str, str] = {}
+        missing: List[str] = []
+        for task_id in task_ids:
+            task = self.tasks.get(task_id)
+            if task is None:
+                missing.append(task_id)
+            else:
+                statuses[task_id] = task.status
+        
+        if missing:
+            db = SessionLocal()
+            try:
+                statuses.update(db.query(Task.id, Task.status).filter(Task.id.in_(missing)).all())
+            finally:
+                db.close()
+        return statuses
+    
+    def task_count(self) -> int:
+        """Total number of tasks, resident or archived"""
+        return sum(self.status_counts.values())
+    
+    def iter_task_summaries(self, limit: int = 50) -> Iterator[Tuple[str, str, str]]:
+        """Stream (id, title, status) for the newest persisted tasks without loading full rows"""
+        db = SessionLocal()
+        try:
+            rows = db.query(Task.id, Task.title, Task.status).order_by(
+                Task.created_at.desc()
+            ).limit(limit).yield_per(100)
+            for task_id, title, status in rows:
+                yield task_id, title, status
+        finally:
+            db.close()
+    
+    def get_recent_messages(self, limit: int) -> List[Dict[str, Any]]:
+        """Get the most recent messages, oldest first"""
+        return list(itertools.islice(reversed(self.messages), limit))[::-1]
+    
     def get_system_status(self) -> Dict[str, Any]:
         """Get current system status and metrics"""
-        active_tasks = sum(1 for task in self.tasks.values() 
-                          if task["status"] in [TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS])
+        now = time.monotonic()
+        if (self._status_cache is not None
+                and self._status_cache_version == self.state_version
+                and now - self._status_cache_ts < PLATFORM_CONFIG["status_cache_ttl_ms"] / 1000):
+            return self._status_cache
+        
+        active_tasks = self.status_counts[TaskStatus.ASSIGNED] + self.status_counts[TaskStatus.IN_PROGRESS]
         
         agent_status = {}
         for agent_id, agent in self.agents.items():
@@ -620,12 +1129,16 @@ class OrchestrationEngine:
                 "performance": agent.performance_metrics
             }
         
-        return {
+        self._status_cache = {
             "system_metrics": self.system_metrics,
             "active_tasks": active_tasks,
-            "pending_tasks": len(self.task_queue),
+            "task_counts": {status.value: count for status, count in self.status_counts.items()},
+            "pending_tasks": len(self._task_heap) + len(self._deferred),
             "total_agents": len(self.agents),
             "agent_status": agent_status,
             "active_collaborations": len(self.active_collaborations),
-            "recent_messages": self.messages[-10:] if self.messages else []
+            "recent_messages": self.get_recent_messages(10)
         }
+        self._status_cache_version = self.state_version
+        self._status_cache_ts = now
+        return self._status_cache
@@ -4,21 +4,22 @@ Demo script for the Multi-Agent Orchestration Platform
 Run this script to start the platform and execute sample tasks
 """
 import asyncio
-import time
-import threading
 import uvicorn
 from orchestrator import OrchestrationEngine
 from sample_tasks import run_demo_scenario
 
-def start_web_server():
-    """Start the FastAPI web server in a separate thread"""
-    uvicorn.run(
+def create_web_server() -> uvicorn.Server:
+    """Create the FastAPI web server to run on the demo's own event loop"""
+    config = uvicorn.Config(
         "main:app",
         host="0.0.0.0",
         port=8000,
+        http="httptools",
+        ws="websockets",
         log_level="info",
         reload=False
     )
+    return uvicorn.Server(config)
 
 async def main():
     """Main demo function"""
@@ -26,14 +27,18 @@ async def main():
     print("=" * 60)
     print()
     
-    # Start web server in background
+    # Start web server on this event loop, alongside the demo
     print("🌐 Starting web server...")
-    server_thread = threading.Thread(target=start_web_server, daemon=True)
-    server_thread.start()
+    server = create_web_server()
+    server_task = asyncio.create_task(server.serve())
     
     # Wait for server to start
     print("⏳ Waiting for server to initialize...")
-    time.sleep(3)
+    while not server.started and not server_task.done():
+        await asyncio.sleep(0.1)
+    if server_task.done():
+        print("❌ Web server failed to start")
+        return
     
     # Create orchestration engine
     print("🤖 Initializing orchestration engine...")
@@ -56,14 +61,18 @@ async def main():
     print("\n🎉 Demo completed!")
     print("💡 The web server is still running. Press Ctrl+C to exit.")
     
-    # Keep the script running to maintain the web server
-    try:
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
-        print("\n👋 Shutting down...")
+    # Keep the script running until the web server is stopped
+    await server_task
+    print("\n👋 Shutting down...")
 
 if __name__ == "__main__":
+    # Run the server and demo on uvloop when it is installed (it ships with uvicorn[standard])
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -2,232 +2,175 @@
 Sample tasks and test scenarios for the Multi-Agent Orchestration Platform
 """
 import asyncio
+import functools
+import hashlib
 import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from types import MappingProxyType
+from typing import FrozenSet, List, Dict, Any
 
-# Sample tasks that demonstrate different agent capabilities and collaboration scenarios
-SAMPLE_TASKS = [
-    {
-        "title": "Market Research for AI Startup",
-        "description": "Conduct comprehensive market research for a new AI startup focusing on healthcare applications. Include competitor analysis, market size estimation, and growth projections.",
-        "task_type": "research_task",
-        "required_capabilities": ["data_analysis", "web_research", "market_research"],
-        "priority": 2,
-        "expected_complexity": "medium"
-    },
-    {
-        "title": "Build Customer Management API",
-        "description": "Develop a RESTful API for customer management with CRUD operations, authentication, and data validation. Include proper error handling and documentation.",
-        "task_type": "development_task",
-        "required_capabilities": ["code_generation", "architecture_design", "testing"],
-        "priority": 3,
-        "expected_complexity": "high"
-    },
-    {
-        "title": "Create Marketing Campaign Content",
-        "description": "Design a comprehensive marketing campaign for a sustainable fashion brand. Include social media posts, blog articles, and email newsletter content.",
-        "task_type": "creative_task",
-        "required_capabilities": ["content_creation", "creative_writing", "brainstorming"],
-        "priority": 1,
-        "expected_complexity": "medium"
-    },
-    {
-        "title": "Sales Performance Analysis",
-        "description": "Analyze quarterly sales data to identify trends, patterns, and opportunities. Provide statistical insights and recommendations for improvement.",
-        "task_type": "analysis_task",
-        "required_capabilities": ["statistical_analysis", "data_processing", "pattern_recognition"],
-        "priority": 2,
-        "expected_complexity": "medium"
-    },
-    {
-        "title": "Technical Documentation Translation",
-        "description": "Translate technical documentation from English to Spanish and French, ensuring technical accuracy and cultural appropriateness.",
-        "task_type": "communication_task",
-        "required_capabilities": ["translation", "language_processing", "communication_drafting"],
-        "priority": 1,
-        "expected_complexity": "low"
-    },
-    {
-        "title": "E-commerce Platform Development",
-        "description": "Build a complete e-commerce platform with product catalog, shopping cart, payment integration, user management, and analytics dashboard.",
-        "task_type": "complex_task",
-        "required_capabilities": ["code_generation", "architecture_design", "data_processing", "creative_writing", "testing"],
-        "priority": 5,
-        "expected_complexity": "very_high"
-    },
-    {
-        "title": "Brand Identity Research and Design",
-        "description": "Research target audience preferences and create a complete brand identity including logo concepts, color schemes, and brand messaging guidelines.",
-        "task_type": "complex_task",
-        "required_capabilities": ["market_research", "creative_writing", "design_thinking", "data_analysis"],
-        "priority": 4,
-        "expected_complexity": "high"
-    },
-    {
-        "title": "AI Model Performance Optimization",
-        "description": "Analyze machine learning model performance, identify bottlenecks, and implement optimization strategies to improve accuracy and reduce inference time.",
-        "task_type": "complex_task",
-        "required_capabilities": ["statistical_analysis", "code_generation", "optimization", "pattern_recognition"],
-        "priority": 4,
-        "expected_complexity": "high"
-    },
-    {
-        "title": "Customer Feedback Sentiment Analysis",
-        "description": "Process and analyze customer feedback from multiple channels to understand sentiment trends and extract actionable insights for product improvement.",
-        "task_type": "analysis_task",
-        "required_capabilities": ["sentiment_analysis", "data_processing", "statistical_analysis"],
-        "priority": 2,
-        "expected_complexity": "medium"
-    },
-    {
-        "title": "Interactive Data Visualization Dashboard",
-        "description": "Create an interactive web dashboard for visualizing business metrics with real-time updates, filtering capabilities, and export functionality.",
-        "task_type": "development_task",
-        "required_capabilities": ["code_generation", "data_processing", "creative_writing"],
-        "priority": 3,
-        "expected_complexity": "high"
-    }
-]
+import msgspec
 
-# Collaboration scenarios that test inter-agent communication
-COLLABORATION_SCENARIOS = [
-    {
-        "name": "Code Review Collaboration",
-        "description": "Code Agent requests review from Analysis Agent for performance optimization",
-        "requesting_agent_type": "code",
-        "required_capabilities": ["statistical_analysis", "optimization"],
-        "collaboration_type": "review",
-        "message": "Please review this algorithm for performance bottlenecks and suggest optimizations"
-    },
-    {
-        "name": "Research Validation",
-        "description": "Research Agent seeks validation from Communication Agent for report clarity",
-        "requesting_agent_type": "research",
-        "required_capabilities": ["communication_drafting", "language_processing"],
-        "collaboration_type": "assistance",
-        "message": "Please help improve the clarity and readability of this research report"
-    },
-    {
-        "name": "Creative Content Analysis",
-        "description": "Creative Agent requests sentiment analysis for marketing content",
-        "requesting_agent_type": "creative",
-        "required_capabilities": ["sentiment_analysis", "data_processing"],
-        "collaboration_type": "assistance",
-        "message": "Please analyze the emotional impact and sentiment of this marketing content"
-    }
-]
+from models import TaskCreate, TaskStatus
+
+# Sample tasks, collaboration scenarios and performance test scenarios live in a JSON
+# resource that is read on first use, so importing TaskGenerator alone stays cheap
+SAMPLE_DATA_PATH = Path(__file__).with_name("sample_data.json")
+
+def _submit_payload(task_template: Dict[str, Any]) -> TaskCreate:
+    """Pick the fields the orchestrator accepts out of a sample task template"""
+    return TaskCreate(
+        title=task_template["title"],
+        description=task_template["description"],
+        task_type=task_template["task_type"],
+        required_capabilities=task_template["required_capabilities"],
+        priority=task_template.get("priority", 1)
+    )
+
+# Identical capability sets share one list of interned names, keyed by frozenset
+_CAP_POOL: Dict[FrozenSet[str], List[str]] = {}
+
+def _intern_caps(capabilities: List[str]) -> List[str]:
+    """Canonical shared list for a capability set; agent matching itself uses the engine's bitsets"""
+    return _CAP_POOL.setdefault(frozenset(capabilities), [sys.intern(c) for c in capabilities])
 
-# Performance test scenarios
-PERFORMANCE_TESTS = [
-    {
-        "name": "Load Test - Multiple Simple Tasks",
-        "description": "Submit 10 simple tasks simultaneously to test load balancing",
-        "task_count": 10,
-        "task_complexity": "low",
-        "expected_duration": 30  # seconds
-    },
-    {
-        "name": "Complex Task Decomposition",
-        "description": "Submit complex tasks that require decomposition",
-        "task_count": 3,
-        "task_complexity": "very_high",
-        "expected_duration": 120  # seconds
-    },
-    {
-        "name": "Mixed Workload Test",
-        "description": "Submit mix of simple and complex tasks",
-        "task_count": 15,
-        "task_complexity": "mixed",
-        "expected_duration": 60  # seconds
+@functools.lru_cache(maxsize=None)
+def _sample_data() -> Dict[str, Any]:
+    """Load the sample data file and build its derived views, once"""
+    data = json.loads(SAMPLE_DATA_PATH.read_bytes())
+    
+    # Templates are shared by the views below, so freeze them; callers copy before editing.
+    # Each carries its ready-made submission payload so it is not rebuilt on every submit
+    sample_tasks = []
+    for task in data["tasks"]:
+        task["required_capabilities"] = _intern_caps(task["required_capabilities"])
+        sample_tasks.append(MappingProxyType({**task, "_submit_payload": _submit_payload(task)}))
+    
+    return {
+        "SAMPLE_TASKS": sample_tasks,
+        # Sample tasks grouped by expected complexity
+        "TASKS_BY_COMPLEXITY": {
+            complexity: [t for t in sample_tasks if t["expected_complexity"] == complexity]
+            for complexity in ("low", "medium", "high", "very_high")
+        },
+        # Collaboration scenarios that test inter-agent communication
+        "COLLABORATION_SCENARIOS": data["collaboration_scenarios"],
+        # Performance test scenarios; expected_duration is in seconds
+        "PERFORMANCE_TESTS": data["performance_tests"]
     }
-]
+
+def __getattr__(name: str) -> Any:
+    """Expose the sample data views as lazily loaded module attributes"""
+    data = _sample_data()
+    if name in data:
+        return data[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class TaskGenerator:
     """Generate and submit sample tasks for testing"""
     
     def __init__(self, orchestrator):
         self.orchestrator = orchestrator
+        # agent_type -> agent IDs, rebuilt when the agent count changes
+        self._agents_by_type: Dict[str, List[str]] = {}
+        self._agents_by_type_size: int = -1
+        # Scenario content hash -> dummy task ID created for it
+        self._collab_tasks: Dict[str, str] = {}
+    
+    def _get_agents_by_type(self) -> Dict[str, List[str]]:
+        """Index the orchestrator's agents by type, reusing the index while the agent set is unchanged"""
+        agents = self.orchestrator.agents
+        if len(agents) != self._agents_by_type_size:
+            index = defaultdict(list)
+            for agent_id, agent in agents.items():
+                index[agent.agent_type].append(agent_id)
+            self._agents_by_type = dict(index)
+            self._agents_by_type_size = len(agents)
+        return self._agents_by_type
+    
+    @staticmethod
+    def _task_payload(task_template: Dict[str, Any]) -> TaskCreate:
+        """Submission payload for a template, reusing the precomputed one for built-in samples"""
+        payload = task_template.get("_submit_payload")
+        return payload if payload is not None else _submit_payload(task_template)
     
     async def submit_sample_task(self, task_template: Dict[str, Any]) -> str:
         """Submit a single sample task"""
-        task_data = {
-            "title": task_template["title"],
-            "description": task_template["description"],
-            "task_type": task_template["task_type"],
-            "required_capabilities": task_template["required_capabilities"],
-            "priority": task_template.get("priority", 1)
-        }
-        
-        return await self.orchestrator.submit_task(task_data)
+        return await self.orchestrator.submit_task(self._task_payload(task_template))
+    
+    async def submit_sample_tasks(self, task_templates: List[Dict[str, Any]]) -> List[str]:
+        """Submit several sample tasks through the orchestrator's bulk entry point"""
+        return await self.orchestrator.submit_tasks([
+            self._task_payload(task_template) for task_template in task_templates
+        ])
     
     async def submit_all_samples(self) -> List[str]:
         """Submit all sample tasks"""
-        task_ids = []
+        # Highest priority first (stable, so ties keep file order) so those are registered
+        # and start their decomposition checks ahead of the rest
+        sample_tasks = sorted(_sample_data()["SAMPLE_TASKS"], key=lambda t: -t.get("priority", 1))
+        try:
+            task_ids = await self.submit_sample_tasks(sample_tasks)
+        except Exception as e:
+            print(f"Failed to submit sample tasks: {e}")
+            return []
         
-        for task_template in SAMPLE_TASKS:
-            try:
-                task_id = await self.submit_sample_task(task_template)
-                task_ids.append(task_id)
-                print(f"Submitted sample task: {task_template['title']} (ID: {task_id})")
-                
-                # Small delay to avoid overwhelming the system
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                print(f"Failed to submit task '{task_template['title']}': {e}")
+        for task_template, task_id in zip(sample_tasks, task_ids):
+            print(f"Submitted sample task: {task_template['title']} (ID: {task_id})")
         
         return task_ids
     
     async def run_performance_test(self, test_scenario: Dict[str, Any]) -> Dict[str, Any]:
         """Run a performance test scenario"""
         print(f"Starting performance test: {test_scenario['name']}")
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         
         task_ids = []
         
         # Select appropriate tasks based on complexity
-        if test_scenario["task_complexity"] == "low":
-            selected_tasks = [t for t in SAMPLE_TASKS if t.get("expected_complexity") == "low"]
-        elif test_scenario["task_complexity"] == "very_high":
-            selected_tasks = [t for t in SAMPLE_TASKS if t.get("expected_complexity") == "very_high"]
-        elif test_scenario["task_complexity"] == "mixed":
-            selected_tasks = SAMPLE_TASKS
-        else:
-            selected_tasks = SAMPLE_TASKS
+        # ("mixed" and any unknown complexity use the full set)
+        data = _sample_data()
+        selected_tasks = data["TASKS_BY_COMPLEXITY"].get(test_scenario["task_complexity"], data["SAMPLE_TASKS"])
         
-        # Submit tasks
-        for i in range(test_scenario["task_count"]):
-            task_template = selected_tasks[i % len(selected_tasks)]
-            
-            # Modify task title to indicate it's a test
-            modified_task = task_template.copy()
-            modified_task["title"] = f"[TEST] {modified_task['title']} #{i+1}"
-            
-            try:
-                task_id = await self.submit_sample_task(modified_task)
-                task_ids.append(task_id)
-            except Exception as e:
-                print(f"Failed to submit test task {i+1}: {e}")
+        # Build every test task up front, then submit them in one bulk call
+        # Payloads and "[TEST] <title> #" prefixes are resolved once per template, not per task
+        payloads = [self._task_payload(task_template) for task_template in selected_tasks]
+        title_prefixes = [f"[TEST] {task_template['title']} #" for task_template in selected_tasks]
+        n_templates = len(selected_tasks)
         
-        # Wait for completion or timeout
-        timeout = test_scenario.get("expected_duration", 60)
-        await asyncio.sleep(timeout)
+        # Override only the title to indicate it's a test
+        test_payloads = [
+            msgspec.structs.replace(payloads[i % n_templates], title=title_prefixes[i % n_templates] + str(i + 1))
+            for i in range(test_scenario["task_count"])
+        ]
         
-        # Collect results
-        completed_tasks = 0
-        failed_tasks = 0
+        try:
+            task_ids = await self.orchestrator.submit_tasks(test_payloads)
+        except Exception as e:
+            print(f"Failed to submit test tasks: {e}")
         
-        for task_id in task_ids:
-            task = self.orchestrator.tasks.get(task_id)
-            if task:
-                if task["status"] == "completed":
-                    completed_tasks += 1
-                elif task["status"] == "failed":
-                    failed_tasks += 1
+        # Report progress as tasks finish, until all are done or the scenario's timeout elapses
+        timeout = test_scenario.get("expected_duration", 60)
+        futures = [self.orchestrator.completion_future(task_id) for task_id in task_ids]
+        finished = 0
+        try:
+            for next_done in asyncio.as_completed(futures, timeout=timeout):
+                await next_done
+                finished += 1
+                print(f"  {finished}/{len(futures)} test tasks finished")
+        except asyncio.TimeoutError:
+            # Just stop waiting: the futures are shared with other waiters and settled by the engine
+            pass
+        
+        # Collect results in one pass over the tasks' current statuses
+        status_counts = Counter(self.orchestrator.get_status_bulk(task_ids).values())
+        completed_tasks = status_counts[TaskStatus.COMPLETED]
+        failed_tasks = status_counts[TaskStatus.FAILED]
         
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
+        duration = (time.monotonic_ns() - start_ns) / 1e9
         
         results = {
             "test_name": test_scenario["name"],
@@ -248,26 +191,28 @@ class TaskGenerator:
         print(f"Simulating collaboration: {scenario['name']}")
         
         # Find an agent of the requesting type
-        requesting_agent = None
-        for agent_id, agent in self.orchestrator.agents.items():
-            if agent.agent_type == scenario["requesting_agent_type"]:
-                requesting_agent = agent_id
-                break
+        requesting_agent = next(iter(self._get_agents_by_type().get(scenario["requesting_agent_type"], [])), None)
         
         if not requesting_agent:
             print(f"No agent found of type: {scenario['requesting_agent_type']}")
             return None
         
-        # Create a dummy task for collaboration
-        task_data = {
-            "title": f"Collaboration Test: {scenario['name']}",
-            "description": scenario["description"],
-            "task_type": "collaboration_test",
-            "required_capabilities": scenario["required_capabilities"],
-            "priority": 1
-        }
-        
-        task_id = await self.orchestrator.submit_task(task_data)
+        # The dummy task is derived purely from the scenario, so an identical scenario
+        # reuses the task created last time, as long as the orchestrator still knows it
+        key = hashlib.blake2b(json.dumps(scenario, sort_keys=True).encode(), digest_size=16).hexdigest()
+        task_id = self._collab_tasks.get(key)
+        if task_id is None or self.orchestrator.get_task(task_id) is None:
+            # Create a dummy task for collaboration
+            task_data = TaskCreate(
+                title=f"Collaboration Test: {scenario['name']}",
+                description=scenario["description"],
+                task_type="collaboration_test",
+                required_capabilities=scenario["required_capabilities"],
+                priority=1
+            )
+            
+            task_id = await self.orchestrator.submit_task(task_data)
+            self._collab_tasks[key] = task_id
         
         # Request collaboration
         collaboration_id = await self.orchestrator.request_collaboration(
@@ -290,17 +235,18 @@ async def run_demo_scenario(orchestrator):
     
     # Submit a few sample tasks
     print("\n📝 Submitting sample tasks...")
-    sample_task_ids = []
-    
-    for i, task in enumerate(SAMPLE_TASKS[:5]):  # Submit first 5 tasks
-        task_id = await generator.submit_sample_task(task)
-        sample_task_ids.append(task_id)
+    demo_tasks = _sample_data()["SAMPLE_TASKS"][:5]  # Submit first 5 tasks
+    async with asyncio.TaskGroup() as tg:
+        submissions = [tg.create_task(generator.submit_sample_task(task)) for task in demo_tasks]
+    sample_task_ids = [submission.result() for submission in submissions]
+    for task, task_id in zip(demo_tasks, sample_task_ids):
         print(f"  ✓ {task['title']} (ID: {task_id})")
-        await asyncio.sleep(2)  # Wait between submissions
     
-    # Wait for some tasks to complete
+    # Wait for some tasks to complete, returning early if they all finish. Unfinished
+    # futures are left alone: they are shared with other waiters and settled by the engine
     print("\n⏳ Waiting for tasks to process...")
-    await asyncio.sleep(10)
+    futures = [orchestrator.completion_future(task_id) for task_id in sample_task_ids]
+    await asyncio.wait(futures, timeout=10)
     
     # Show system status
     print("\n📊 Current System Status:")
@@ -313,13 +259,15 @@ async def run_demo_scenario(orchestrator):
     
     # Simulate collaboration
     print("\n🤝 Testing agent collaboration...")
-    for scenario in COLLABORATION_SCENARIOS[:2]:  # Test first 2 scenarios
-        await generator.simulate_collaboration(scenario)
-        await asyncio.sleep(3)
+    async with asyncio.TaskGroup() as tg:
+        for scenario in _sample_data()["COLLABORATION_SCENARIOS"][:2]:  # Test first 2 scenarios
+            tg.create_task(generator.simulate_collaboration(scenario))
     
     # Run a performance test
     print("\n⚡ Running performance test...")
-    perf_results = await generator.run_performance_test(PERFORMANCE_TESTS[0])
+    async with asyncio.TaskGroup() as tg:
+        perf_test = tg.create_task(generator.run_performance_test(_sample_data()["PERFORMANCE_TESTS"][0]))
+    perf_results = perf_test.result()
     print(f"  • Throughput: {perf_results['throughput']:.2f} tasks/second")
     print(f"  • Success Rate: {perf_results['success_rate']:.2%}")
     
@@ -329,6 +277,7 @@ async def run_demo_scenario(orchestrator):
 if __name__ == "__main__":
     # This can be run independently for testing
     print("Sample tasks and scenarios loaded.")
-    print(f"Available sample tasks: {len(SAMPLE_TASKS)}")
-    print(f"Collaboration scenarios: {len(COLLABORATION_SCENARIOS)}")
-    print(f"Performance tests: {len(PERFORMANCE_TESTS)}")
+    data = _sample_data()
+    print(f"Available sample tasks: {len(data['SAMPLE_TASKS'])}")
+    print(f"Collaboration scenarios: {len(data['COLLABORATION_SCENARIOS'])}")
+    print(f"Performance tests: {len(data['PERFORMANCE_TESTS'])}")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script to verify batched LLM calls do not queue behind batches already in flight
+"""
+import asyncio
+import time
+
+from llm_batcher import LLMBatcher
+
+ABATCH_SECONDS = 0.3
+
+class _SlowLLM:
+    """Stand-in LLM whose abatch takes a fixed time regardless of batch size"""
+
+    def __init__(self):
+        self.batches = []
+
+    async def abatch(self, inputs, return_exceptions=False):
+        self.batches.append(len(inputs))
+        await asyncio.sleep(ABATCH_SECONDS)
+        return [f"response {i}" for i in range(len(inputs))]
+
+async def _run_overlap_check():
+    llm = _SlowLLM()
+    batcher = LLMBatcher(lambda: llm, wait_ms=8)
+    start = time.monotonic()
+
+    async def call(delay):
+        await asyncio.sleep(delay)
+        await batcher.submit([])
+        return time.monotonic() - start
+
+    # The second caller misses the first batch's window and must get its own batch right away
+    first, second = await asyncio.gather(call(0), call(0.05))
+    print(f"📊 First call: {first:.2f}s, second call: {second:.2f}s, batches: {llm.batches}")
+    assert llm.batches == [1, 1], llm.batches
+    assert second < 2 * ABATCH_SECONDS, "second batch waited for the first batch to finish"
+
+def test_batches_overlap():
+    """A batch collected while another is in flight is sent without waiting for it"""
+    print("🧪 Testing overlapping LLM batches...")
+    asyncio.run(_run_overlap_check())
+    print("✅ Batches were in flight concurrently")
+
+if __name__ == "__main__":
+    test_batches_overlap()
@@ -23,10 +23,15 @@ async def test_persistence():
     task_id = await orchestrator.submit_task(test_task)
     print(f"✅ Submitted test task: {task_id}")
     
-    # Check current tasks
-    print(f"📊 Current tasks in memory: {len(orchestrator.tasks)}")
-    for tid, task in orchestrator.tasks.items():
-        print(f"  - {task['title']} (Status: {task['status']})")
+    # Database writes are batched in the background, so wait for them to land
+    await orchestrator.flush_pending_writes()
+    
+    # Check current tasks, streaming only the newest rows back from the database
+    print(f"📊 Current tasks: {orchestrator.task_count()}")
+    for tid, title, status in orchestrator.iter_task_summaries(limit=50):
+        print(f"  - {title} (Status: {status})")
+    
+    await orchestrator.close()
     
     print("\n🔄 Now restart the server and check if tasks persist!")
     print("💡 Run: python main.py")
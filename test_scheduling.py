@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the scheduler spreads tasks across agents instead of overfilling one
+"""
+import asyncio
+import os
+import tempfile
+from collections import defaultdict
+from unittest import mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import orchestrator as orchestrator_module
+from agents import BaseAgent
+from config import AGENT_TYPES, LLM_CONFIG, PLATFORM_CONFIG
+from orchestrator import OrchestrationEngine
+
+RESEARCH_MAX = AGENT_TYPES["research"]["max_concurrent_tasks"]
+RESEARCH_AGENTS = PLATFORM_CONFIG["max_agents_per_type"]
+
+def _research_task(i: int) -> dict:
+    return {
+        "title": f"Scheduling Test Task #{i + 1}",
+        "description": "Research-only task used to check agent capacity",
+        "task_type": "research_task",
+        # Only research agents have this capability
+        "required_capabilities": ["web_research"]
+    }
+
+async def _run_spread_check(submit):
+    """Submit more tasks than one agent can hold and check how they were placed"""
+    running = defaultdict(int)
+    peak = defaultdict(int)
+
+    async def fake_llm_task(agent, task, stream=False):
+        # Stand-in for the LLM call that tracks how many tasks each agent runs at once
+        running[agent.agent_id] += 1
+        peak[agent.agent_id] = max(peak[agent.agent_id], running[agent.agent_id])
+        await asyncio.sleep(0.05)
+        running[agent.agent_id] -= 1
+        return "done"
+
+    async def no_decomposition(engine, task):
+        return False
+
+    # No LLM is called, but building the clients still needs some API key
+    with mock.patch.object(BaseAgent, "_run_llm_task", fake_llm_task), \
+            mock.patch.object(OrchestrationEngine, "_needs_decomposition", no_decomposition), \
+            mock.patch.dict(LLM_CONFIG, {"api_key": LLM_CONFIG["api_key"] or "test-key"}):
+        orchestrator = OrchestrationEngine()
+
+        task_count = RESEARCH_MAX * RESEARCH_AGENTS
+        task_ids = await submit(orchestrator, [_research_task(i) for i in range(task_count)])
+
+        futures = [orchestrator.completion_future(task_id) for task_id in task_ids]
+        statuses = await asyncio.wait_for(asyncio.gather(*futures), timeout=10)
+        tasks = [orchestrator.tasks[task_id] for task_id in task_ids]
+        await orchestrator.close()
+
+    print(f"📊 Peak concurrent tasks per agent: {sorted(peak.values())}")
+    assert all(status == "completed" for status in statuses), statuses
+    assert all(task.retry_count == 0 for task in tasks), "tasks were retried after hitting agent capacity"
+    assert max(peak.values()) <= RESEARCH_MAX, f"an agent ran more than {RESEARCH_MAX} tasks at once"
+    assert len({task.assigned_agent_id for task in tasks}) == RESEARCH_AGENTS, "tasks were not spread across agents"
+
+async def _submit_one_by_one(orchestrator, tasks_data):
+    return await asyncio.gather(*(orchestrator.submit_task(task_data) for task_data in tasks_data))
+
+async def _submit_bulk(orchestrator, tasks_data):
+    return await orchestrator.submit_tasks(tasks_data)
+
+def _run_with_temp_database(submit):
+    with tempfile.TemporaryDirectory() as tmp:
+        # Point the engine at a throwaway SQLite file instead of the repo's orchestration.db
+        test_engine = create_engine(f"sqlite:///{os.path.join(tmp, 'orchestration.db')}")
+        test_sessions = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+        try:
+            with mock.patch.object(orchestrator_module, "engine", test_engine), \
+                    mock.patch.object(orchestrator_module, "SessionLocal", test_sessions):
+                asyncio.run(_run_spread_check(submit))
+        finally:
+            test_engine.dispose()
+
+def test_tasks_spread_across_agents():
+    """Tasks submitted together fill every research agent without exceeding any agent's capacity"""
+    print("🧪 Testing task spreading across agents...")
+    _run_with_temp_database(_submit_one_by_one)
+    print("✅ Tasks were spread across agents within capacity")
+
+def test_bulk_submission_spreads_across_agents():
+    """A single submit_tasks batch lands in one scheduler pass and must still respect capacity"""
+    print("🧪 Testing bulk submission spreading across agents...")
+    _run_with_temp_database(_submit_bulk)
+    print("✅ Bulk-submitted tasks were spread across agents within capacity")
+
+if __name__ == "__main__":
+    test_tasks_spread_across_agents()
+    test_bulk_submission_spreads_across_agents()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script to verify bulk status lookups cover resident, archived and unknown tasks
+"""
+import asyncio
+import os
+import tempfile
+from unittest import mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import orchestrator as orchestrator_module
+from agents import BaseAgent
+from config import LLM_CONFIG
+from models import TaskStatus
+from orchestrator import OrchestrationEngine
+
+def _task(i: int) -> dict:
+    return {
+        "title": f"Status Test Task #{i + 1}",
+        "description": "Task used to check bulk status lookups",
+        "task_type": "research_task",
+        "required_capabilities": ["web_research"]
+    }
+
+async def _run_status_check():
+    async def fake_llm_task(agent, task, stream=False):
+        return "done"
+
+    async def no_decomposition(engine, task):
+        return False
+
+    # No LLM is called, but building the clients still needs some API key
+    with mock.patch.object(BaseAgent, "_run_llm_task", fake_llm_task), \
+            mock.patch.object(OrchestrationEngine, "_needs_decomposition", no_decomposition), \
+            mock.patch.dict(LLM_CONFIG, {"api_key": LLM_CONFIG["api_key"] or "test-key"}):
+        orchestrator = OrchestrationEngine()
+
+        resident_id, archived_id = await orchestrator.submit_tasks([_task(0), _task(1)])
+        await asyncio.wait_for(asyncio.gather(
+            orchestrator.completion_future(resident_id),
+            orchestrator.completion_future(archived_id)
+        ), timeout=10)
+
+        # Persist the final rows, then drop one task from memory as if it had aged out
+        await orchestrator.flush_pending_writes()
+        del orchestrator.tasks[archived_id]
+
+        statuses = orchestrator.get_status_bulk([resident_id, archived_id, "no-such-task"])
+        await orchestrator.close()
+
+    print(f"📊 Statuses: {statuses}")
+    assert statuses == {
+        resident_id: TaskStatus.COMPLETED,
+        archived_id: TaskStatus.COMPLETED
+    }, statuses
+
+def test_get_status_bulk():
+    """Resident tasks are read from memory, archived ones from the database, unknown IDs are left out"""
+    print("🧪 Testing bulk status lookup...")
+    with tempfile.TemporaryDirectory() as tmp:
+        # Point the engine at a throwaway SQLite file instead of the repo's orchestration.db
+        test_engine = create_engine(f"sqlite:///{os.path.join(tmp, 'orchestration.db')}")
+        test_sessions = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+        try:
+            with mock.patch.object(orchestrator_module, "engine", test_engine), \
+                    mock.patch.object(orchestrator_module, "SessionLocal", test_sessions):
+                asyncio.run(_run_status_check())
+        finally:
+            test_engine.dispose()
+    print("✅ Bulk status lookup returned every known task")
+
+if __name__ == "__main__":
+    test_get_status_bulk()